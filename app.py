@@ -1,5 +1,6 @@
 import getopt
 import io
+import os
 import sys
 
 import k8v
@@ -8,12 +9,33 @@ import k8v
 def usage(output: io.IOBase) -> None:
     """Display the command line usage help screen."""
 
-    with open("etc/usage.md") as f:
+    with open(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "etc/usage.md")
+    ) as f:
         for line in f.readlines():
             output.write(line)
         f.close()
 
 
+def fail(viewer: k8v.viewer.Viewer, message: str) -> None:
+    """Display the command line usage help screen followed by an error and exit."""
+    usage(viewer.config.file)
+    print(f"ERROR: {message}")
+    print()
+    sys.exit(2)
+
+
+def parse_count(viewer: k8v.viewer.Viewer, opt: str, arg: str) -> int:
+    """Parse the value of an option which must be a positive integer (ex: --page-size 100)."""
+    try:
+        value = int(arg)
+    except ValueError:
+        value = 0
+    if value < 1:
+        fail(viewer, f"option {opt} requires a positive integer (not {arg!r})")
+    return value
+
+
 def main(argv: list) -> None:
     """Main execution to setup the Viewer."""
 
@@ -21,28 +43,44 @@ def main(argv: list) -> None:
     try:
         opts, args = getopt.getopt(
             argv,
-            "ARtvhc:e:f:i:n:o:r:s:",
+            "ARtvwhc:e:f:i:n:N:o:r:s:",
             [
                 "all-related",
                 "all-resources",
                 "colors",
                 "all-namespaces",
+                "async",
+                "cache-ttl=",
                 "exclude",
+                "exclude-namespace=",
                 "file",
+                "from-snapshot=",
+                "gzip",
                 "help",
                 "include",
+                "max-inflight=",
+                "metrics=",
+                "metrics-prom=",
+                "name=",
                 "namespace",
+                "no-keep-alive",
                 "output",
+                "page-size=",
+                "parallel=",
+                "phase=",
+                "pool-size=",
+                "profile",
+                "profile-format=",
+                "raw",
+                "refresh",
                 "resource",
                 "selector",
                 "verbose",
+                "watch",
             ],
         )
     except getopt.GetoptError as e:
-        usage(viewer.config.file)
-        print(f"ERROR: {e}")
-        print()
-        sys.exit(2)
+        fail(viewer, str(e))
 
     for opt, arg in opts:
         # display the help
@@ -57,8 +95,43 @@ def main(argv: list) -> None:
             viewer.config.output = arg
         elif opt in ("-v", "--verbose"):
             viewer.config.verbose = True
+        elif opt in ("-w", "--watch"):
+            viewer.config.watch = True
         elif opt in ("-f", "--file"):
             viewer.config.filename = arg
+        elif opt == "--page-size":
+            viewer.config.page_size = parse_count(viewer, opt, arg)
+        elif opt == "--parallel":
+            viewer.config.parallel = parse_count(viewer, opt, arg)
+        elif opt == "--async":
+            viewer.config.asynchronous = True
+        elif opt == "--max-inflight":
+            viewer.config.max_inflight = parse_count(viewer, opt, arg)
+        elif opt == "--raw":
+            viewer.config.raw = True
+        elif opt == "--gzip":
+            viewer.config.gzip = True
+        elif opt == "--no-keep-alive":
+            viewer.config.keep_alive = False
+        elif opt == "--pool-size":
+            viewer.config.pool_size = parse_count(viewer, opt, arg)
+        elif opt == "--metrics":
+            viewer.config.metrics_file = arg
+        elif opt == "--metrics-prom":
+            viewer.config.metrics_prom = arg
+        elif opt == "--profile":
+            viewer.config.profile = True
+        elif opt == "--profile-format":
+            viewer.config.profile = True
+            viewer.config.profile_format = arg
+
+        # caching
+        elif opt == "--cache-ttl":
+            viewer.config.cache_ttl = parse_count(viewer, opt, arg)
+        elif opt == "--refresh":
+            viewer.config.refresh = True
+        elif opt == "--from-snapshot":
+            viewer.config.snapshot = arg
 
         # namespaces
         elif opt in ("-A", "--all-namespaces"):
@@ -67,6 +140,8 @@ def main(argv: list) -> None:
             if viewer.config.namespaces is None:
                 viewer.config.namespaces = []
             viewer.config.namespaces.append(arg)
+        elif opt == "--exclude-namespace":
+            viewer.config.excluded_namespaces.append(arg)
 
         # search criteria
         elif opt in ("-t", "--all-related"):
@@ -75,6 +150,10 @@ def main(argv: list) -> None:
             viewer.config.excludes.append(arg)
         elif opt in ("-i", "--include"):
             viewer.config.includes.append(arg)
+        elif opt in ("-N", "--name"):
+            viewer.config.names.append(arg)
+        elif opt == "--phase":
+            viewer.config.phase = arg
         elif opt in ("-R", "--all-resources"):
             viewer.config.resources = None
         elif opt in ("-r", "--resource"):
@@ -89,6 +168,10 @@ def main(argv: list) -> None:
     for arg in args:
         viewer.config.includes.append(arg)
 
+    # schedule the list calls as asyncio tasks if requested
+    if viewer.config.asynchronous:
+        viewer.searcher = viewer.create_searcher()
+
     # Search for matching resources and display them
     viewer.view()
 
@@ -0,0 +1,229 @@
+"""Benchmark the search, filter and format pipeline against a synthetic cluster.
+
+Each stage is run once to measure its throughput and then again while tracing memory allocations
+(see: tracemalloc) to measure its peak memory, since tracing slows everything down considerably.
+"""
+
+import gc
+import getopt
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import k8v
+from k8v.compact import compact
+from k8v.resource_types import ResourceType
+
+from benchmarks.cluster import ClusterGenerator
+
+FORMATTERS = ["brief", "default", "json", "ndjson", "pickle", "snapshot"]
+STAGES = ["generate", "filter", "search", "compact", "format"]
+
+
+def measure(name: str, count: int, run, memory: bool = True) -> dict:
+    """Measure the throughput and (optionally) peak memory of a stage processing count objects."""
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "stage": name,
+        "objects": count,
+        "seconds": elapsed,
+        "objects_per_second": count / elapsed if elapsed > 0 else None,
+        "peak_bytes": peak,
+    }
+
+
+class Benchmark:
+    """Run each stage of the pipeline against the resources of a synthetic cluster."""
+
+    def __init__(self, generator: ClusterGenerator, memory: bool = True):
+        self.generator = generator
+        self.memory = memory
+        self.resources: dict = {}
+
+    @property
+    def all_resources(self) -> list:
+        return [r for resources in self.resources.values() for r in resources]
+
+    def create_viewer(self, **kwargs) -> k8v.viewer.Viewer:
+        """Create a Viewer searching the generated resources (in memory) instead of a cluster."""
+        config = k8v.config.Config(
+            **dict({"filename": os.devnull, "namespaces": None}, **kwargs)
+        )
+        config.load()
+        viewer = k8v.viewer.Viewer(config)
+        backend = k8v.backends.snapshot_backend.SnapshotBackend(config)
+        for type, resources in self.resources.items():
+            backend.resources[type] = {r.metadata.uid: r for r in resources}
+        viewer.searcher.backend = backend
+        return viewer
+
+    def stage_generate(self) -> list:
+        def run():
+            self.resources = self.generator.generate()
+
+        run()
+        count = len(self.all_resources)
+        return [measure("generate", count, run, self.memory)]
+
+    def stage_filter(self) -> list:
+        """Filter every resource by name (includes and excludes) and labels."""
+        viewer = self.create_viewer(
+            includes=["api", "web", "cache"],
+            excludes=["-1", "-2"],
+            selectors={"tier": "backend"},
+        )
+        resources = self.all_resources
+
+        def run():
+            for _ in viewer.searcher.filter_resources(resources):
+                pass
+
+        return [measure("filter", len(resources), run, self.memory)]
+
+    def stage_search(self) -> list:
+        """Search for deployments and pods including their related resources."""
+        types = [ResourceType.DEPLOYMENTS, ResourceType.PODS]
+
+        def run():
+            viewer = self.create_viewer(related=True, resources=types)
+            for _ in viewer.stream():
+                pass
+
+        count = sum(len(self.resources[type]) for type in types)
+        return [measure("search", count, run, self.memory)]
+
+    def stage_compact(self) -> list:
+        resources = self.all_resources
+
+        def run():
+            return [compact(r) for r in resources]
+
+        return [measure("compact", len(resources), run, self.memory)]
+
+    def stage_format(self, formatters: list) -> list:
+        """Display every resource using each formatter (written to /dev/null)."""
+        resources = self.all_resources
+        results: list = []
+        for output in formatters:
+
+            def run():
+                config = k8v.config.Config(filename=os.devnull, output=output)
+                config.load()
+                k8v.printer.Printer(config).print_all(resources)
+                if not config.file.closed:
+                    config.file.close()
+
+            results.append(
+                measure(f"format:{output}", len(resources), run, self.memory)
+            )
+        return results
+
+    def run(self, stages: list, formatters: list) -> list:
+        """Run the stages (resources are always generated first) and return their results."""
+        results: list = self.stage_generate()
+        for stage in stages:
+            if stage == "format":
+                results += self.stage_format(formatters)
+            elif stage != "generate":
+                results += getattr(self, f"stage_{stage}")()
+        if "generate" not in stages:
+            results.pop(0)
+        return results
+
+
+def report(results: list, file=sys.stdout) -> None:
+    """Display the results as a table."""
+    file.write(
+        f"{'stage':<18} {'objects':>9} {'seconds':>9} {'objects/s':>11} {'peak MiB':>9}\n"
+    )
+    for r in results:
+        peak = "-" if r["peak_bytes"] is None else f"{r['peak_bytes'] / 1048576:.1f}"
+        rate = r["objects_per_second"] or 0
+        file.write(
+            f"{r['stage']:<18} {r['objects']:>9} {r['seconds']:>9.3f} {rate:>11.0f} {peak:>9}\n"
+        )
+
+
+def usage() -> None:
+    print(f"""usage: python3 -m benchmarks.benchmark [OPTIONS]
+
+        -d, --deployments=N     number of deployments to generate (default: 1000)
+        -r, --replicas=N        number of pods for each deployment (default: 3)
+        -n, --namespaces=N      number of namespaces to spread the resources across (default: 10)
+        -s, --stage=STAGE       stage to run ({", ".join(STAGES)}); can be specified more than once
+        -o, --output=TYPE       formatter to run ({", ".join(FORMATTERS)}); can be specified more than once
+        -j, --json=FILE         also write the results as JSON to FILE (ex: to compare releases)
+        --no-memory             do not measure the peak memory of each stage (faster)
+""")
+
+
+def main(argv: list) -> None:
+    try:
+        opts, args = getopt.getopt(
+            argv,
+            "hd:j:n:o:r:s:",
+            [
+                "deployments=",
+                "help",
+                "json=",
+                "namespaces=",
+                "no-memory",
+                "output=",
+                "replicas=",
+                "stage=",
+            ],
+        )
+    except getopt.GetoptError as e:
+        usage()
+        print(f"ERROR: {e}")
+        sys.exit(2)
+
+    kwargs: dict = {}
+    stages: list = []
+    formatters: list = []
+    filename: str = None
+    memory: bool = True
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            usage()
+            sys.exit()
+        elif opt in ("-d", "--deployments"):
+            kwargs["deployments"] = int(arg)
+        elif opt in ("-r", "--replicas"):
+            kwargs["replicas"] = int(arg)
+        elif opt in ("-n", "--namespaces"):
+            kwargs["namespaces"] = int(arg)
+        elif opt in ("-s", "--stage"):
+            stages.append(arg)
+        elif opt in ("-o", "--output"):
+            formatters.append(arg)
+        elif opt in ("-j", "--json"):
+            filename = arg
+        elif opt == "--no-memory":
+            memory = False
+
+    results = Benchmark(ClusterGenerator(**kwargs), memory).run(
+        stages or STAGES, formatters or FORMATTERS
+    )
+    report(results)
+    if filename is not None:
+        with open(filename, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
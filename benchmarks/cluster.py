@@ -0,0 +1,325 @@
+"""Generate synthetic clusters of kubernetes.client models for benchmarks (and large snapshots)."""
+
+import datetime
+import getopt
+import random
+import sys
+import uuid
+
+from kubernetes.client import models
+from kubernetes.client.configuration import Configuration
+
+from k8v.resource_types import ResourceType
+from k8v.snapshot import SnapshotWriter
+
+# how each ResourceType generated is reported by the Kubernetes API
+API_VERSIONS = {
+    ResourceType.CONFIG_MAP: ("v1", "ConfigMap"),
+    ResourceType.DEPLOYMENTS: ("apps/v1", "Deployment"),
+    ResourceType.PODS: ("v1", "Pod"),
+    ResourceType.REPLICA_SETS: ("apps/v1", "ReplicaSet"),
+}
+
+APPS = ["api", "web", "worker", "cache", "auth", "search", "billing", "events"]
+TIERS = ["frontend", "backend", "data"]
+PHASES = ["Running"] * 18 + ["Pending", "Succeeded"]
+
+
+class ClusterGenerator:
+    """Build deployments (with their replicasets and pods) and configmaps spread over namespaces.
+
+    The resources are related the same way as in a real cluster: replicasets and pods are owned
+    by their deployment / replicaset and selected by labels, and pods reference a configmap.
+    """
+
+    def __init__(
+        self,
+        deployments: int = 1000,
+        replicas: int = 3,
+        namespaces: int = 10,
+        seed: int = 0,
+    ):
+        self.deployments = deployments
+        self.replicas = replicas
+        self.namespaces = [f"team-{n}" for n in range(namespaces)]
+        self.random = random.Random(seed)
+        self.configuration = Configuration()
+        self.configuration.client_side_validation = False
+        self.created = datetime.datetime(
+            2022, 1, 31, 7, 50, 4, tzinfo=datetime.timezone.utc
+        )
+
+    def new(self, model: type, **kwargs):
+        """Create a model sharing one configuration (as the models deserialized by an ApiClient do)."""
+        return model(local_vars_configuration=self.configuration, **kwargs)
+
+    def uid(self) -> str:
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def suffix(self, length: int) -> str:
+        return "".join(self.random.choices("bcdfghjklmnpqrstvwxz2456789", k=length))
+
+    def annotate(self, resource, type: ResourceType):
+        """Annotate a resource the same way the Searcher does for list results."""
+        resource.type = type
+        resource.apiVersion, resource.kind = API_VERSIONS[type]
+        resource._related = []
+        return resource
+
+    def metadata(self, name: str, namespace: str, labels: dict, owner=None, kind=None):
+        return self.new(
+            models.V1ObjectMeta,
+            name=name,
+            namespace=namespace,
+            labels=labels,
+            uid=self.uid(),
+            resource_version=str(self.random.randint(1000, 999999)),
+            generation=1,
+            creation_timestamp=self.created,
+            owner_references=(
+                None
+                if owner is None
+                else [
+                    self.new(
+                        models.V1OwnerReference,
+                        api_version="apps/v1",
+                        kind=kind,
+                        name=owner.metadata.name,
+                        uid=owner.metadata.uid,
+                        controller=True,
+                        block_owner_deletion=True,
+                    )
+                ]
+            ),
+        )
+
+    def configmap(self, name: str, namespace: str, labels: dict):
+        return self.annotate(
+            self.new(
+                models.V1ConfigMap,
+                metadata=self.metadata(name, namespace, labels),
+                data={
+                    "ENV": self.random.choice(["dev", "test", "prod"]),
+                    "LOG_LEVEL": "info",
+                    "config.yaml": "replicas: 3\n" * 20,
+                },
+            ),
+            ResourceType.CONFIG_MAP,
+        )
+
+    def pod_spec(self, app: str, configmap: str):
+        return self.new(
+            models.V1PodSpec,
+            service_account=app,
+            service_account_name=app,
+            containers=[
+                self.new(
+                    models.V1Container,
+                    name=app,
+                    image=f"registry.example.com/{app}:1.{self.random.randint(0, 20)}",
+                    image_pull_policy="IfNotPresent",
+                    env_from=[
+                        self.new(
+                            models.V1EnvFromSource,
+                            config_map_ref=self.new(
+                                models.V1ConfigMapEnvSource, name=configmap
+                            ),
+                        )
+                    ],
+                    ports=[
+                        self.new(
+                            models.V1ContainerPort, container_port=8080, protocol="TCP"
+                        )
+                    ],
+                    resources=self.new(
+                        models.V1ResourceRequirements,
+                        requests={"cpu": "100m", "memory": "128Mi"},
+                    ),
+                    volume_mounts=[
+                        self.new(
+                            models.V1VolumeMount,
+                            mount_path="/etc/config",
+                            name="config",
+                        )
+                    ],
+                )
+            ],
+            volumes=[
+                self.new(
+                    models.V1Volume,
+                    name="config",
+                    config_map=self.new(models.V1ConfigMapVolumeSource, name=configmap),
+                )
+            ],
+            dns_policy="ClusterFirst",
+            restart_policy="Always",
+        )
+
+    def deployment(self, name: str, namespace: str, labels: dict, configmap: str):
+        return self.annotate(
+            self.new(
+                models.V1Deployment,
+                metadata=self.metadata(name, namespace, labels),
+                spec=self.new(
+                    models.V1DeploymentSpec,
+                    replicas=self.replicas,
+                    selector=self.new(
+                        models.V1LabelSelector,
+                        match_labels={
+                            "app": labels["app"],
+                            "release": labels["release"],
+                        },
+                    ),
+                    strategy=self.new(
+                        models.V1DeploymentStrategy,
+                        type="RollingUpdate",
+                        rolling_update=self.new(
+                            models.V1RollingUpdateDeployment,
+                            max_surge="25%",
+                            max_unavailable="25%",
+                        ),
+                    ),
+                    template=self.new(
+                        models.V1PodTemplateSpec,
+                        metadata=self.new(models.V1ObjectMeta, labels=labels),
+                        spec=self.pod_spec(labels["app"], configmap),
+                    ),
+                ),
+                status=self.new(
+                    models.V1DeploymentStatus,
+                    replicas=self.replicas,
+                    ready_replicas=self.replicas,
+                    updated_replicas=self.replicas,
+                    available_replicas=self.replicas,
+                    observed_generation=1,
+                ),
+            ),
+            ResourceType.DEPLOYMENTS,
+        )
+
+    def get_configmap_name(self, deployment) -> str:
+        return deployment.spec.template.spec.volumes[0].config_map.name
+
+    def replicaset(self, deployment, hash: str):
+        labels = dict(deployment.metadata.labels, **{"pod-template-hash": hash})
+        return self.annotate(
+            self.new(
+                models.V1ReplicaSet,
+                metadata=self.metadata(
+                    f"{deployment.metadata.name}-{hash}",
+                    deployment.metadata.namespace,
+                    labels,
+                    deployment,
+                    "Deployment",
+                ),
+                spec=self.new(
+                    models.V1ReplicaSetSpec,
+                    replicas=self.replicas,
+                    selector=self.new(models.V1LabelSelector, match_labels=labels),
+                    template=self.new(
+                        models.V1PodTemplateSpec,
+                        metadata=self.new(models.V1ObjectMeta, labels=labels),
+                        spec=self.pod_spec(
+                            labels["app"], self.get_configmap_name(deployment)
+                        ),
+                    ),
+                ),
+                status=self.new(
+                    models.V1ReplicaSetStatus,
+                    replicas=self.replicas,
+                    ready_replicas=self.replicas,
+                    available_replicas=self.replicas,
+                ),
+            ),
+            ResourceType.REPLICA_SETS,
+        )
+
+    def pod(self, replicaset, deployment):
+        return self.annotate(
+            self.new(
+                models.V1Pod,
+                metadata=self.metadata(
+                    f"{replicaset.metadata.name}-{self.suffix(5)}",
+                    replicaset.metadata.namespace,
+                    replicaset.metadata.labels,
+                    replicaset,
+                    "ReplicaSet",
+                ),
+                spec=self.pod_spec(
+                    deployment.metadata.labels["app"],
+                    self.get_configmap_name(deployment),
+                ),
+                status=self.new(
+                    models.V1PodStatus,
+                    phase=self.random.choice(PHASES),
+                    pod_ip=f"10.{self.random.randint(0, 255)}.{self.random.randint(0, 255)}.{self.random.randint(1, 254)}",
+                    start_time=self.created,
+                ),
+            ),
+            ResourceType.PODS,
+        )
+
+    def generate(self) -> dict:
+        """Generate the resources of the cluster grouped by ResourceType."""
+        resources: dict = {type: [] for type in API_VERSIONS}
+        for num in range(self.deployments):
+            namespace = self.namespaces[num % len(self.namespaces)]
+            app = APPS[num % len(APPS)]
+            name = f"{app}-{num}"
+            labels = {
+                "app": app,
+                "release": f"r{num}",
+                "tier": self.random.choice(TIERS),
+            }
+
+            configmap = self.configmap(f"{name}-config", namespace, labels)
+            deployment = self.deployment(
+                name, namespace, labels, configmap.metadata.name
+            )
+            replicaset = self.replicaset(deployment, self.suffix(10))
+            resources[ResourceType.CONFIG_MAP].append(configmap)
+            resources[ResourceType.DEPLOYMENTS].append(deployment)
+            resources[ResourceType.REPLICA_SETS].append(replicaset)
+            for _ in range(self.replicas):
+                resources[ResourceType.PODS].append(self.pod(replicaset, deployment))
+        return resources
+
+    def write(self, filename: str) -> int:
+        """Write the generated cluster to a snapshot file (see: --from-snapshot)."""
+        count: int = 0
+        with open(filename, "wb") as f:
+            writer = SnapshotWriter(f)
+            for resources in self.generate().values():
+                for resource in resources:
+                    count += writer.write(resource)
+            writer.close()
+        return count
+
+
+def main(argv: list) -> None:
+    """Write a synthetic cluster to a snapshot file."""
+    opts, args = getopt.getopt(
+        argv,
+        "d:f:n:r:s:",
+        ["deployments=", "file=", "namespaces=", "replicas=", "seed="],
+    )
+    filename = "cluster.snapshot"
+    kwargs: dict = {}
+    for opt, arg in opts:
+        if opt in ("-d", "--deployments"):
+            kwargs["deployments"] = int(arg)
+        elif opt in ("-f", "--file"):
+            filename = arg
+        elif opt in ("-n", "--namespaces"):
+            kwargs["namespaces"] = int(arg)
+        elif opt in ("-r", "--replicas"):
+            kwargs["replicas"] = int(arg)
+        elif opt in ("-s", "--seed"):
+            kwargs["seed"] = int(arg)
+
+    count = ClusterGenerator(**kwargs).write(filename)
+    print(f"Wrote {count} resources to {filename}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,14 +1,18 @@
 __project__ = "k8v"
 __version__ = "0.2.0"
 
-import k8v.config
-import k8v.resource_types
-import k8v.searcher
-import k8v.viewer
-import k8v.formatters
-import k8v.formatters.formatter
-import k8v.formatters.brief_formatter
-import k8v.formatters.default_formatter
-import k8v.formatters.json_formatter
-import k8v.formatters.pickle_formatter
-import k8v.printer
+import importlib
+
+
+def __getattr__(name: str):
+    """Import submodules (ex: k8v.searcher) the first time they are used rather than up front (PEP 562).
+
+    This keeps startup fast since heavy dependencies (ex: the kubernetes client) are only imported
+    when they are actually needed.
+    """
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
@@ -0,0 +1,126 @@
+import asyncio
+
+from k8v.backends.async_kubernetes_backend import AsyncKubernetesBackend
+from k8v.resource_types import ResourceType
+from k8v.searcher import Searcher
+
+# the type of the related resources searched for each type (see: Searcher.search_for_related)
+RELATED_TYPES = {
+    ResourceType.DEPLOYMENTS: ResourceType.REPLICA_SETS,
+    ResourceType.DAEMON_SETS: ResourceType.PODS,
+    ResourceType.JOBS: ResourceType.PODS,
+    ResourceType.REPLICA_SETS: ResourceType.PODS,
+    ResourceType.STATEFUL_SETS: ResourceType.PODS,
+}
+
+
+class AsyncSearcher(Searcher):
+    """A Searcher that awaits every list call as an asyncio task from a single thread (see: --async).
+
+    The list calls for each type and namespace, and for the related resources of those types, are
+    all scheduled up front on one event loop using kubernetes_asyncio, with at most *max_inflight*
+    of them in flight at once. The results are filtered and related the same way as the Searcher and
+    yielded for each type in the order requested as soon as the type has completed.
+    """
+
+    def __init__(self, viewer):
+        super().__init__(viewer)
+        self.backend = AsyncKubernetesBackend(self.config)
+        self.loop = None
+        self.semaphore = None
+        self._pending = {}
+
+    def setup_backend(self):
+        if self.config.snapshot is not None:
+            super().setup_backend()
+        else:
+            self.get_loop().run_until_complete(self.backend.open())
+
+    def setup_executor(self):
+        """Limit the number of list calls in flight (no worker threads are used)."""
+        self.semaphore = asyncio.Semaphore(self.config.max_inflight)
+
+    def close(self):
+        if self.loop is not None:
+            # cancel the searches still in flight (ex: when the results are not all consumed)
+            tasks = [task for task in asyncio.all_tasks(self.loop) if not task.done()]
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self.loop.run_until_complete(
+                    asyncio.gather(*tasks, return_exceptions=True)
+                )
+            self._pending.clear()
+
+            if isinstance(self.backend, AsyncKubernetesBackend):
+                self.loop.run_until_complete(self.backend.close())
+            self.loop.close()
+            self.loop = None
+            self.semaphore = None
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+        if self.semaphore is None:
+            self.setup_executor()
+        return self.loop
+
+    async def collect_async(self, call: tuple, filtered: bool) -> list:
+        """Await a list call once one of the *max_inflight* slots is available and collect the resources."""
+        type, handler, namespace, params = call
+
+        # resources in a snapshot are already in memory
+        if not self.backend.live:
+            return self.collect(call, filtered)
+
+        async with self.semaphore:
+            if self.cache is None:
+                resources, resource_version = await self.backend.fetch_all(
+                    type, handler, namespace, **params
+                )
+            else:
+                resources = await self.cache.list_async(
+                    self.backend.fetch_all, type, handler, namespace, **params
+                )
+
+        return self.prepare(type, resources, filtered)
+
+    async def gather(self, calls: list, filtered: bool) -> list:
+        """Issue the list calls for a type concurrently and merge their results in order."""
+        responses = await asyncio.gather(
+            *[self.collect_async(call, filtered) for call in calls]
+        )
+        return [r for resources in responses for r in resources]
+
+    def prefetch_related(self, types: list) -> None:
+        """Schedule the searches for the related resources of the types so they run alongside them."""
+        loop = self.get_loop()
+        for type in types:
+            type = RELATED_TYPES.get(type)
+            while type is not None:
+                if type not in self._related and type not in self._pending:
+                    calls = self.get_calls([type], filtered=False)[0]
+                    self._pending[type] = loop.create_task(
+                        self.gather(calls, filtered=False)
+                    )
+                type = RELATED_TYPES.get(type)
+
+    def get_related_candidates(self, type: ResourceType) -> list:
+        """Retrieve every resource of the specified type once (waiting for it if already scheduled)."""
+        if type not in self._related and type in self._pending:
+            resources = self.get_loop().run_until_complete(self._pending.pop(type))
+            self._related[type] = self.complete(type, resources)
+        return super().get_related_candidates(type)
+
+    def search_all(self, types: list, filtered: bool = True, **kwargs):
+        """Search for resources of each of the specified types and yield a list of results per type."""
+        loop = self.get_loop()
+        tasks = [
+            loop.create_task(self.gather(calls, filtered))
+            for calls in self.get_calls(types, filtered, **kwargs)
+        ]
+        if self.config.related:
+            self.prefetch_related(types)
+
+        for type, task in zip(types, tasks):
+            yield self.complete(type, loop.run_until_complete(task))
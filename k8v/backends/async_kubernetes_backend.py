@@ -0,0 +1,139 @@
+import gzip
+import time
+
+from k8v.backends.kubernetes_backend import KubernetesBackend
+from k8v.registry import get_registry
+from k8v.resource_types import ResourceType
+
+
+class AsyncKubernetesBackend(KubernetesBackend):
+    """The Backend used to list resources from a live cluster using kubernetes_asyncio (see: --async).
+
+    Each list call is awaited on the event loop of the AsyncSearcher so many of them can be in
+    flight from a single thread. The responses are parsed into the same kubernetes.client models
+    (or RawResources) as the KubernetesBackend.
+    """
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.async_client = None
+
+    async def open(self) -> None:
+        """Load the Kubernetes configuration and setup API endpoint connections."""
+        import kubernetes
+        import kubernetes_asyncio
+
+        await kubernetes_asyncio.config.load_kube_config()
+        self.async_client = self.create_async_client(
+            kubernetes_asyncio.client.Configuration.get_default_copy()
+        )
+
+        # only used to deserialize the responses into the kubernetes.client models
+        self.api_client = kubernetes.client.ApiClient()
+
+        def create_api(group: str):
+            if not hasattr(kubernetes_asyncio.client, group):
+                raise Exception(f"invalid resource handler {group}")
+            return getattr(kubernetes_asyncio.client, group)(self.async_client)
+
+        self.handlers = get_registry().bind(create_api)
+
+    async def close(self) -> None:
+        if self.async_client is not None:
+            await self.async_client.close()
+
+    def create_async_client(self, configuration):
+        """Create the kubernetes_asyncio ApiClient with its connection pool tuned for the search.
+
+        The REST client of kubernetes_asyncio is used as is for the TLS settings and proxy of the
+        configuration. Its pool holds a connection for each list call in flight (see: --max-inflight),
+        connections are closed after each request with --no-keep-alive, and responses are only
+        compressed with --gzip. Responses are decompressed by the backend so the bytes received can
+        be measured.
+        """
+        import aiohttp
+        import kubernetes_asyncio
+
+        configuration.connection_pool_maxsize = (
+            self.config.pool_size or self.config.max_inflight
+        )
+        api_client = kubernetes_asyncio.client.ApiClient(configuration)
+
+        # reuse the connector of the session created by the REST client
+        rest_client = api_client.rest_client
+        connector = rest_client.pool_manager.connector
+        rest_client.pool_manager.detach()
+        rest_client.pool_manager = aiohttp.ClientSession(
+            connector=connector, auto_decompress=False
+        )
+
+        if not self.config.keep_alive:
+            api_client.set_default_header("Connection", "close")
+        api_client.set_default_header(
+            "Accept-Encoding", "gzip" if self.config.gzip else "identity"
+        )
+        return api_client
+
+    async def call_async(
+        self, type: ResourceType, handler, namespace: str = None, **kwargs
+    ) -> bytes:
+        """Await an API handler and read the (decompressed) response body, recording the request when
+        profiling ("api" phase) or exporting metrics.
+
+        Other tasks run while the request is in flight so only its elapsed time is recorded.
+        """
+        from kubernetes_asyncio.client.exceptions import ApiException
+
+        metrics = self.config.metrics
+        profiler = self.config.profiler
+        start = time.perf_counter()
+        try:
+            if namespace is None:
+                response = await handler(_preload_content=False, **kwargs)
+            else:
+                response = await handler(namespace, _preload_content=False, **kwargs)
+            wire = await response.read()
+            if not 200 <= response.status <= 299:
+                raise ApiException(status=response.status, reason=response.reason)
+            data = wire
+            if response.headers.get("Content-Encoding") == "gzip":
+                data = gzip.decompress(wire)
+        except Exception:
+            elapsed = time.perf_counter() - start
+            profiler.record("api", type, elapsed)
+            if metrics.enabled:
+                metrics.record(type, namespace, elapsed, error=True)
+            raise
+
+        elapsed = time.perf_counter() - start
+        profiler.record("api", type, elapsed, len(data))
+        if metrics.enabled:
+            metrics.record(type, namespace, elapsed, len(data), wire_bytes=len(wire))
+        return data
+
+    async def fetch_all(
+        self, type: ResourceType, handler, namespace: str = None, **kwargs
+    ) -> tuple:
+        """Page through the results of a list call and return the annotated resources and the list's resourceVersion."""
+        if self.config.page_size > 0:
+            kwargs["limit"] = self.config.page_size
+        if self.config.verbose:
+            print(f"Searching for {type.value[0]}")
+
+        resources: list = []
+        while True:
+            try:
+                data = await self.call_async(type, handler, namespace, **kwargs)
+            except Exception as e:
+                print(
+                    f"Exeception occurred while searching for resources ({type.value[0]}): {e}"
+                )
+                raise e
+
+            items, token, resource_version = self.parse_response(type, namespace, data)
+            resources.extend(items)
+
+            # request the next page (if any) using the continue token
+            if not token:
+                return resources, resource_version
+            kwargs["_continue"] = token
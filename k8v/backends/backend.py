@@ -0,0 +1,32 @@
+from typing import Protocol
+
+from k8v.resource_types import ResourceType
+
+
+class Backend(Protocol):
+    """Backends are used by the Searcher to retrieve resources from a source (ex: a live cluster)."""
+
+    def setup(self) -> None:
+        """Prepare the backend for searching (ex: connect to the cluster)."""
+
+    def get_context(self) -> str:
+        """Retrieve a name identifying the source of the resources (ex: for caching)."""
+
+    def get_api_handler(self, type: ResourceType) -> object:
+        """Retrieve the handler used to list resources of the specified type (None if not supported)."""
+
+    def fetch_resources(
+        self, type: ResourceType, handler, namespace: str = None, **kwargs
+    ):
+        """Yield the annotated resources for a list call and return the list's resourceVersion."""
+
+
+class BackendBase(Backend):
+    # the backend lists resources from a live cluster (results can be cached, watched, etc.)
+    live: bool = False
+
+    def __init__(self, config):
+        self.config = config
+
+    def setup(self) -> None:
+        pass
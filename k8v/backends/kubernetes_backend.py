@@ -0,0 +1,215 @@
+import socket
+import time
+import types
+
+from k8v import fastjson
+from k8v.backends.backend import BackendBase
+from k8v.raw_resource import RawResource
+from k8v.registry import get_registry
+from k8v.resource_types import ResourceType
+
+
+class KubernetesBackend(BackendBase):
+    """The Backend used to list resources from a live cluster using the Kubernetes API."""
+
+    live = True
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.handlers = {}
+
+    def setup(self) -> None:
+        """Load the Kubernetes configuration and setup API endpoint connections."""
+        import kubernetes
+
+        self.kubernetes_config = kubernetes.config.load_kube_config()
+        self.api_client = self.create_api_client()
+
+        def create_api(group: str):
+            if not hasattr(kubernetes.client, group):
+                raise Exception(f"invalid resource handler {group}")
+            return getattr(kubernetes.client, group)(self.api_client)
+
+        self.handlers = get_registry().bind(create_api)
+
+    def create_api_client(self):
+        """Create the ApiClient (using the loaded configuration) with its connection pool tuned for the search.
+
+        The pool holds a connection for each list call issued concurrently (see: --parallel) so they
+        never wait on each other, and idle connections are probed (TCP keep-alive) to keep them open
+        between requests. Responses are compressed by the API server when using --gzip.
+        """
+        import kubernetes
+        import urllib3
+
+        configuration = kubernetes.client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = self.config.pool_size or max(
+            self.config.parallel, 4
+        )
+        api_client = kubernetes.client.ApiClient(configuration)
+
+        if self.config.keep_alive:
+            api_client.rest_client.pool_manager.connection_pool_kw["socket_options"] = (
+                urllib3.connection.HTTPConnection.default_socket_options
+                + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            )
+        else:
+            api_client.set_default_header("Connection", "close")
+        if self.config.gzip:
+            api_client.set_default_header("Accept-Encoding", "gzip")
+        return api_client
+
+    def get_context(self) -> str:
+        import kubernetes
+
+        return kubernetes.config.list_kube_config_contexts()[1]["name"]
+
+    def get_api_handler(self, type: ResourceType):
+        """Retrieve the API handler function to use for the specified namespace(s) and ResourceType."""
+        handler = self.handlers.get(type)
+        if handler is None:
+            return None
+
+        # return the "all" or "namespace" specific handler as needed
+        return handler.all if self.config.namespaces is None else handler.ns
+
+    def get_model_type(self, type: ResourceType) -> str:
+        """Retrieve the name of the kubernetes.client model class for the specified ResourceType."""
+        handler = self.handlers.get(type)
+        return handler.model_type if handler is not None else None
+
+    def call(
+        self,
+        type: ResourceType,
+        handler,
+        namespace: str = None,
+        read: bool = False,
+        **kwargs,
+    ) -> tuple:
+        """Call an API handler, recording the request when profiling ("api" phase) or exporting metrics.
+
+        When read is set the response body is retrieved as is (see: _preload_content) so its size can
+        be recorded. The response is returned along with the body (empty unless read).
+        """
+        metrics = self.config.metrics
+        data = b""
+        wire_bytes = 0
+        start = time.perf_counter()
+        try:
+            with self.config.profiler.phase("api", type) as phase:
+                if namespace is None:
+                    api_response = handler(**kwargs)
+                else:
+                    api_response = handler(namespace, **kwargs)
+                if read:
+                    data = api_response.data
+                    wire_bytes = api_response.tell()
+                    phase.add_bytes(len(data))
+        except Exception:
+            if metrics.enabled:
+                metrics.record(type, namespace, time.perf_counter() - start, error=True)
+            raise
+
+        if metrics.enabled:
+            metrics.record(
+                type,
+                namespace,
+                time.perf_counter() - start,
+                len(data),
+                wire_bytes=wire_bytes,
+            )
+        return api_response, data
+
+    @staticmethod
+    def annotate(resource, type: ResourceType, api_version: str, kind: str) -> None:
+        """Annotate a resource with its ResourceType, apiVersion and kind.
+
+        Models with their own type field (ex: the type of a Secret) keep its value as _model_type
+        since the field is replaced by the ResourceType (see: serializer).
+        """
+        if "type" in getattr(resource, "openapi_types", ()):
+            resource._model_type = resource.type
+        resource.type = type
+        resource.apiVersion = api_version
+        resource.kind = kind
+
+    def parse_response(
+        self, type: ResourceType, namespace: str, data: bytes, api_response=None
+    ) -> tuple:
+        """Parse a page of a list call into (annotated resources, continue token, resourceVersion).
+
+        The response body (data) is deserialized into the models unless the response was already
+        deserialized by the client (api_response), or parsed into RawResources in *raw* mode.
+        """
+        profiler = self.config.profiler
+        if self.config.raw:
+            model = RawResource.get_model(self.get_model_type(type))
+            with profiler.phase("parse", type):
+                body = fastjson.loads(data)
+                items = [RawResource(item, model) for item in body["items"]]
+            api_version = body["apiVersion"]
+            kind = body["kind"].replace("List", "")
+            token = body["metadata"].get("continue")
+            resource_version = body["metadata"].get("resourceVersion")
+        else:
+            if api_response is None:
+                with profiler.phase("deserialize", type):
+                    api_response = self.api_client.deserialize(
+                        types.SimpleNamespace(data=data),
+                        f"{self.get_model_type(type)}List",
+                    )
+            api_version = api_response.api_version
+            kind = api_response.kind.replace("List", "")
+            items = api_response.items
+            token = api_response.metadata._continue
+            resource_version = api_response.metadata.resource_version
+
+        if self.config.metrics.enabled:
+            self.config.metrics.add_items(type, namespace, len(items))
+
+        for d in items:
+            self.annotate(d, type, api_version, kind)
+        return items, token, resource_version
+
+    def fetch_resources(
+        self, type: ResourceType, handler, namespace: str = None, **kwargs
+    ):
+        """Page through the results of a list call and yield the annotated resources as each page arrives.
+
+        In *raw* mode the response body is parsed directly into plain dicts (see: RawResource) which
+        skips the deserialization into the generated kubernetes.client models. The resourceVersion
+        of the list is returned once all of the pages have been retrieved.
+
+        When profiling (or exporting metrics) the response body is also retrieved as is and then
+        deserialized into the models, so the size of the responses (as received and once decompressed)
+        and the time spent deserializing them can be reported.
+        """
+        metrics = self.config.metrics
+        preload = not (self.config.raw or self.config.profile or metrics.enabled)
+        if self.config.page_size > 0:
+            kwargs["limit"] = self.config.page_size
+        if not preload:
+            kwargs["_preload_content"] = False
+        if self.config.verbose:
+            print(f"Searching for {type.value[0]}")
+
+        while True:
+            try:
+                api_response, data = self.call(
+                    type, handler, namespace, read=not preload, **kwargs
+                )
+            except Exception as e:
+                print(
+                    f"Exeception occurred while searching for resources ({type.value[0]}): {e}"
+                )
+                raise e
+
+            items, token, resource_version = self.parse_response(
+                type, namespace, data, api_response if preload else None
+            )
+            yield from items
+
+            # request the next page (if any) using the continue token
+            if not token:
+                return resource_version
+            kwargs["_continue"] = token
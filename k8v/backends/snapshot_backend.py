@@ -0,0 +1,146 @@
+import collections
+import os
+import pickle
+import re
+
+from k8v.backends.backend import BackendBase
+from k8v.resource_types import ResourceType
+from k8v.snapshot import SnapshotReader
+
+
+class SnapshotBackend(BackendBase):
+    """The Backend used to search resources previously saved with the snapshot (or pickle) formatter."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.resources = collections.defaultdict(dict)
+        self.entries = collections.defaultdict(list)
+        self.readers = []
+
+    def setup(self) -> None:
+        """Index the resources in the snapshot file (or directory of *.snapshot and *.pickle files) by type.
+
+        Snapshots are memory-mapped and only their index is read up front, while pickle files have to be
+        loaded entirely.
+        """
+        path = self.config.snapshot
+        if os.path.isdir(path):
+            filenames = [
+                os.path.join(path, f)
+                for f in sorted(os.listdir(path))
+                if f.endswith(".pickle") or f.endswith(".snapshot")
+            ]
+        else:
+            filenames = [path]
+
+        for filename in filenames:
+            if SnapshotReader.is_snapshot(filename):
+                reader = SnapshotReader(filename)
+                self.readers.append(reader)
+                for type in reader.types():
+                    self.entries[type].extend(
+                        (reader, entry) for entry in reader.entries(type)
+                    )
+            else:
+                for resource in self.load(filename):
+                    # related resources may have been saved more than once
+                    self.resources[resource.type][resource.metadata.uid] = resource
+
+    def load(self, filename: str):
+        """Yield every resource pickled in the specified file."""
+        with open(filename, "rb") as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    break
+
+    def get_context(self) -> str:
+        return os.path.abspath(self.config.snapshot)
+
+    def get_api_handler(self, type: ResourceType):
+        """Snapshots contain every namespace so the resources (and index entries) are used as the "handler"."""
+        if type not in self.resources and type not in self.entries:
+            return None
+        return (self.resources.get(type, {}), self.entries.get(type, []))
+
+    def get_field(self, resource, path: str):
+        """Resolve a field selector path (ex: metadata.name, status.phase) against a resource."""
+        value = resource
+        for name in path.split("."):
+            name = re.sub(r"([A-Z])", lambda m: "_" + m.group(1).lower(), name)
+            value = getattr(value, name, None)
+        return value
+
+    def is_selected(self, resource, label_selector=None, field_selector=None) -> bool:
+        """Evaluate the label and field selectors that would have been sent to the API server."""
+        if label_selector:
+            labels = resource.metadata.labels or {}
+            for requirement in label_selector.split(","):
+                label, value = requirement.split("=", 1)
+                if labels.get(label) != value:
+                    return False
+        if field_selector:
+            for requirement in field_selector.split(","):
+                if "!=" in requirement:
+                    path, value = requirement.split("!=", 1)
+                    if self.get_field(resource, path) == value:
+                        return False
+                else:
+                    path, value = re.split("==?", requirement, 1)
+                    if self.get_field(resource, path) != value:
+                        return False
+        return True
+
+    def is_candidate(
+        self, entry, namespace=None, label_selector=None, field_selector=None
+    ) -> bool:
+        """Use the index to evaluate as much of the selectors as possible before loading a resource."""
+        if namespace is not None and entry.namespace != namespace:
+            return False
+        if label_selector:
+            for requirement in label_selector.split(","):
+                label, value = requirement.split("=", 1)
+                if entry.labels.get(label) != value:
+                    return False
+        if field_selector:
+            fields = {
+                "metadata.name": entry.name,
+                "metadata.namespace": entry.namespace,
+            }
+            for requirement in field_selector.split(","):
+                if "!=" in requirement:
+                    path, value = requirement.split("!=", 1)
+                    if path in fields and fields[path] == value:
+                        return False
+                else:
+                    path, value = re.split("==?", requirement, 1)
+                    if path in fields and fields[path] != value:
+                        return False
+        return True
+
+    def fetch_resources(
+        self, type: ResourceType, handler, namespace: str = None, **kwargs
+    ):
+        """Yield the snapshot resources in the namespace matching the selectors (snapshots have no resourceVersion)."""
+        label_selector = kwargs.get("label_selector")
+        field_selector = kwargs.get("field_selector")
+        resources, entries = handler
+
+        for resource in resources.values():
+            if namespace is not None and resource.metadata.namespace != namespace:
+                continue
+            if self.is_selected(resource, label_selector, field_selector):
+                yield resource
+
+        # only the matching records are deserialized from snapshots
+        uids = set(resources)
+        for reader, entry in entries:
+            if entry.uid in uids:
+                continue
+            uids.add(entry.uid)
+            if self.is_candidate(entry, namespace, label_selector, field_selector):
+                resource = reader.load(entry)
+                if self.is_selected(resource, field_selector=field_selector):
+                    yield resource
+        return None
@@ -0,0 +1,208 @@
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+import types
+
+from k8v import fastjson
+from k8v.resource_types import ResourceType
+
+
+class ListCache:
+    """An on-disk cache of the resources returned by list calls.
+
+    Each list call (context, type, namespace and selectors) is stored in its own file along with
+    the resourceVersion of the list. Entries are served as-is within the configured TTL. Once an
+    entry has expired a single item is requested to validate the resourceVersion, and the entry
+    is renewed if nothing has changed; otherwise the resources are listed again.
+
+    The resourceVersion of a list is the latest revision of the whole cluster (not just of the
+    resources listed), so expired entries are only renewed while nothing changes in the cluster:
+    renewing them mostly helps with idle (ex: development) clusters.
+    """
+
+    # arguments which do not change the resources returned by a list call
+    IGNORED_ARGS = ["limit", "_continue", "_preload_content"]
+
+    def __init__(self, config, context: str, backend):
+        self.config = config
+        self.context = context
+        self.backend = backend
+        self.directory = config.cache_dir
+        if self.directory is None:
+            self.directory = os.path.join(
+                os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "k8v"
+            )
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_key(self, type: ResourceType, namespace: str, kwargs: dict) -> str:
+        """Determine the key used to store the results of the specified list call."""
+        args = {k: v for k, v in kwargs.items() if k not in self.IGNORED_ARGS}
+        text = json.dumps(
+            [self.context, type.value[0], namespace, self.config.raw, args],
+            sort_keys=True,
+        )
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def load_meta(self, key: str) -> dict:
+        """Load the metadata (resourceVersion and time stored) for a cache entry if it exists."""
+        try:
+            with open(self.get_path(key) + ".json") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def dump_meta(self, f, resource_version: str) -> None:
+        json.dump({"resource_version": resource_version, "time": time.time()}, f)
+
+    def store_meta(self, key: str, resource_version: str) -> None:
+        """Replace the metadata of a cache entry (ex: when renewed) using a temporary file."""
+        fd, filename = tempfile.mkstemp(dir=self.directory, prefix=key, suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                self.dump_meta(f, resource_version)
+            os.replace(filename, self.get_path(key) + ".json")
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def get_resource_version(
+        self, type: ResourceType, handler, namespace: str, kwargs: dict
+    ) -> str:
+        """Request a single resource to determine the current resourceVersion of a list."""
+        args = {k: v for k, v in kwargs.items() if k not in self.IGNORED_ARGS}
+        api_response, data = self.backend.call(
+            type, handler, namespace, limit=1, **args
+        )
+        return api_response.metadata.resource_version
+
+    async def get_resource_version_async(
+        self, type: ResourceType, handler, namespace: str, kwargs: dict
+    ) -> str:
+        """Request a single resource to determine the current resourceVersion of a list (see: --async)."""
+        args = {k: v for k, v in kwargs.items() if k not in self.IGNORED_ARGS}
+        data = await self.backend.call_async(type, handler, namespace, limit=1, **args)
+        return fastjson.loads(data)["metadata"].get("resourceVersion")
+
+    def is_fresh(self, meta: dict) -> bool:
+        return time.time() - meta["time"] < self.config.cache_ttl
+
+    def renew(self, key: str, meta: dict, resource_version: str) -> bool:
+        """Renew an expired cache entry if the resourceVersion of the list has not changed."""
+        if resource_version is None or resource_version != meta["resource_version"]:
+            return False
+        self.store_meta(key, resource_version)
+        return True
+
+    def is_valid(
+        self, key: str, type: ResourceType, handler, namespace: str, kwargs: dict
+    ) -> bool:
+        """Determine if the cache entry can be used, renewing it if it is still up to date."""
+        meta = self.load_meta(key)
+        if meta is None:
+            return False
+        if self.is_fresh(meta):
+            return True
+        return self.renew(
+            key, meta, self.get_resource_version(type, handler, namespace, kwargs)
+        )
+
+    async def is_valid_async(
+        self, key: str, type: ResourceType, handler, namespace: str, kwargs: dict
+    ) -> bool:
+        meta = self.load_meta(key)
+        if meta is None:
+            return False
+        if self.is_fresh(meta):
+            return True
+        return self.renew(
+            key,
+            meta,
+            await self.get_resource_version_async(type, handler, namespace, kwargs),
+        )
+
+    def read(self, key: str):
+        """Yield each resource stored for the cache entry."""
+        with open(self.get_path(key), "rb") as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    break
+
+    def write(self, f, resources):
+        """Write each resource to the file as it is yielded and return the resourceVersion of the list."""
+        while True:
+            try:
+                d = next(resources)
+            except StopIteration as stop:
+                return stop.value
+            pickle.dump(d, f)
+            yield d
+
+    @contextlib.contextmanager
+    def open_entry(self, key: str):
+        """Open temporary files to write a cache entry and its metadata to, replacing both once complete.
+
+        The resources are written to the file of the yielded entry, followed by the resourceVersion
+        of the list once known.
+        """
+        path = self.get_path(key)
+        fd, filename = tempfile.mkstemp(dir=self.directory, prefix=key)
+        meta_fd, meta_filename = tempfile.mkstemp(
+            dir=self.directory, prefix=key, suffix=".json"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f, os.fdopen(meta_fd, "w") as meta:
+                entry = types.SimpleNamespace(file=f, resource_version=None)
+                yield entry
+                self.dump_meta(meta, entry.resource_version)
+            os.replace(filename, path)
+            os.replace(meta_filename, path + ".json")
+        finally:
+            for name in (filename, meta_filename):
+                if os.path.exists(name):
+                    os.remove(name)
+
+    def list(self, fetch, type: ResourceType, handler, namespace: str = None, **kwargs):
+        """Yield the resources for a list call from the cache, or use fetch() and store the results.
+
+        The fetch generator must return the resourceVersion of the list once it is exhausted.
+        """
+        key = self.get_key(type, namespace, kwargs)
+        if not self.config.refresh and self.is_valid(
+            key, type, handler, namespace, kwargs
+        ):
+            yield from self.read(key)
+            return
+
+        with self.open_entry(key) as entry:
+            entry.resource_version = yield from self.write(
+                entry.file, fetch(type, handler, namespace, **kwargs)
+            )
+
+    async def list_async(
+        self, fetch, type: ResourceType, handler, namespace: str = None, **kwargs
+    ) -> list:
+        """Retrieve the resources for a list call from the cache, or await fetch() and store the results.
+
+        The fetch coroutine must return the resources and the resourceVersion of the list.
+        """
+        key = self.get_key(type, namespace, kwargs)
+        if not self.config.refresh and await self.is_valid_async(
+            key, type, handler, namespace, kwargs
+        ):
+            return list(self.read(key))
+
+        resources, resource_version = await fetch(type, handler, namespace, **kwargs)
+        with self.open_entry(key) as entry:
+            for d in resources:
+                pickle.dump(d, entry.file)
+            entry.resource_version = resource_version
+        return resources
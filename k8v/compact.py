@@ -0,0 +1,200 @@
+from k8v.resource_types import ResourceType
+
+# marker used to only keep the keys of a dict (ex: the data of a configmap)
+KEYS = "keys"
+
+# attributes of a resource's metadata used for display, filtering and related lookups
+METADATA = {
+    "name": None,
+    "namespace": None,
+    "labels": None,
+    "uid": None,
+    "resource_version": None,
+    "generation": None,
+    "owner_references": {"uid": None},
+}
+
+SELECTOR = {"match_labels": None, "match_expressions": None}
+
+# the attributes of each ResourceType read by the Searcher and the brief/default formatters
+FIELDS = {
+    ResourceType.CLUSTER_ROLES: {"aggregation_rule": None, "rules": None},
+    ResourceType.CLUSTER_ROLE_BINDINGS: {
+        "role_ref": {"name": None},
+        "subjects": {"kind": None, "name": None},
+    },
+    ResourceType.CONFIG_MAP: {"data": KEYS},
+    ResourceType.CRONJOBS: {},
+    ResourceType.DAEMON_SETS: {"spec": {"selector": SELECTOR}},
+    ResourceType.DEPLOYMENTS: {
+        "spec": {
+            "replicas": None,
+            "selector": SELECTOR,
+            "strategy": {
+                "type": None,
+                "rolling_update": {"max_surge": None, "max_unavailable": None},
+            },
+        },
+        "status": {
+            "replicas": None,
+            "ready_replicas": None,
+            "updated_replicas": None,
+            "available_replicas": None,
+        },
+    },
+    ResourceType.INGRESS: {
+        "metadata": dict(METADATA, annotations=None),
+        "spec": {
+            "ingress_class_name": None,
+            "rules": {
+                "host": None,
+                "http": {
+                    "paths": {
+                        "path": None,
+                        "backend": {
+                            "service": {"name": None, "port": {"number": None}}
+                        },
+                    }
+                },
+            },
+        },
+    },
+    ResourceType.JOBS: {},
+    ResourceType.NETWORK_POLICY: {},
+    ResourceType.PERSISTENT_VOLUME: {
+        "spec": {
+            "storage_class_name": None,
+            "access_modes": None,
+            "capacity": None,
+            "persistent_volume_reclaim_policy": None,
+        },
+        "status": {"phase": None},
+    },
+    ResourceType.PERSISTENT_VOLUME_CLAIM: {
+        "spec": {"storage_class_name": None, "access_modes": None, "volume_name": None},
+        "status": {"capacity": None, "phase": None},
+    },
+    ResourceType.PODS: {
+        "spec": {
+            "service_account": None,
+            "containers": {
+                "env_from": {
+                    "config_map_ref": {"name": None},
+                    "secret_ref": {"name": None},
+                }
+            },
+            "volumes": {
+                "config_map": {"name": None},
+                "secret": {"secret_name": None},
+                "persistent_volume_claim": {"claim_name": None},
+            },
+        },
+        "status": {"phase": None},
+    },
+    ResourceType.REPLICA_SETS: {
+        "spec": {"replicas": None, "selector": SELECTOR},
+        "status": {
+            "replicas": None,
+            "ready_replicas": None,
+            "available_replicas": None,
+        },
+    },
+    ResourceType.ROLES: {"rules": None},
+    ResourceType.ROLE_BINDINGS: {
+        "role_ref": {"name": None},
+        "subjects": {"kind": None, "name": None},
+    },
+    ResourceType.SECRETS: {"data": KEYS},
+    ResourceType.SERVICES: {
+        "spec": {
+            "type": None,
+            "cluster_ip": None,
+            "external_i_ps": None,
+            "load_balancer_ip": None,
+            "ports": {
+                "port": None,
+                "target_port": None,
+                "protocol": None,
+                "node_port": None,
+            },
+        }
+    },
+    ResourceType.SERVICE_ACCOUNTS: {"secrets": {"name": None}},
+    ResourceType.STATEFUL_SETS: {
+        "spec": {
+            "replicas": None,
+            "selector": SELECTOR,
+            "update_strategy": {"type": None},
+        },
+        "status": {
+            "replicas": None,
+            "ready_replicas": None,
+            "updated_replicas": None,
+            "current_replicas": None,
+        },
+    },
+}
+
+
+class CompactRecord:
+    """Base class for the compact (__slots__ based) records created by a Projection."""
+
+    __slots__ = ()
+
+
+class Projection:
+    """A Projection copies only the specified attributes of a resource into a compact record.
+
+    A record class with __slots__ is created for each level of the field definitions so the
+    records have the same shape as the kubernetes.client models (ex: pod.spec.containers[0])
+    while not carrying any of the attributes that are never displayed. Attributes that do not
+    exist on the source object are left unset so hasattr() behaves the same for both.
+    """
+
+    def __init__(self, name: str, fields: dict):
+        self.fields: list = []
+        for field, sub in fields.items():
+            if isinstance(sub, dict):
+                sub = Projection(f"{name}_{field}", sub)
+            self.fields.append((field, sub))
+        self.cls = type(name, (CompactRecord,), {"__slots__": tuple(fields)})
+
+    def project(self, obj):
+        """Copy the attributes of obj (and any nested objects) into a new compact record."""
+        if isinstance(obj, list):
+            return [self.project(o) for o in obj]
+
+        record = self.cls()
+        for field, sub in self.fields:
+            try:
+                value = getattr(obj, field)
+            except AttributeError:
+                continue
+            if value is not None:
+                if sub is KEYS:
+                    value = dict.fromkeys(value)
+                elif sub is not None:
+                    value = sub.project(value)
+            setattr(record, field, value)
+        return record
+
+
+# create the projections for each ResourceType once
+PROJECTIONS = {}
+for resource_type, fields in FIELDS.items():
+    PROJECTIONS[resource_type] = Projection(
+        resource_type.name.title().replace("_", ""),
+        {
+            "type": None,
+            "apiVersion": None,
+            "kind": None,
+            "_related": None,
+            "metadata": METADATA,
+            **fields,
+        },
+    )
+
+
+def compact(resource):
+    """Create a compact record of the resource containing only the attributes used for display."""
+    return PROJECTIONS[resource.type].project(resource)
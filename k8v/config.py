@@ -1,8 +1,10 @@
 import dataclasses
+import importlib
 from io import IOBase
-import json
 import sys
 
+from ansi.color import fg, bg
+import ansi.color.fx as fx
 
 import k8v
 
@@ -11,21 +13,55 @@ import k8v
 class Config:
     """Configuration variables used for the Viewer."""
 
+    # issue the list calls as asyncio tasks (at most max_inflight at once) from a single thread
+    asynchronous: bool = False
+
+    # seconds to reuse cached list results for (0 = disabled)
+    cache_ttl: int = 0
+
+    # directory used to store cached list results (default: ~/.cache/k8v)
+    cache_dir: str = None
+
     # color scheme
     colors: str = "default"
 
     # scheme to use at runtime
     color_scheme: dict = dataclasses.field(default_factory=dict)
 
+    # ANSI codes written before and after text for each key of the scheme (see: compile_color_scheme)
+    color_templates: dict = None
+
+    # keep only the attributes of resources used by the formatter
+    compact: bool = False
+
     # delimeter to use for related resources
     delimeter: str = "        "
 
     # excludes list
     excludes: list = dataclasses.field(default_factory=list)
 
+    # namespaces to exclude when searching all namespaces
+    excluded_namespaces: list = dataclasses.field(default_factory=list)
+
     # includes list
     includes: list = dataclasses.field(default_factory=list)
 
+    # exact names to search for
+    names: list = dataclasses.field(default_factory=list)
+
+    # maximum number of list calls in flight at once when using asyncio (see: asynchronous)
+    max_inflight: int = 64
+
+    # keep connections to the Kubernetes API open between requests using TCP keep-alive probes
+    keep_alive: bool = True
+
+    # files to export metrics about the requests sent to the Kubernetes API to (JSON / Prometheus)
+    metrics_file: str = None
+    metrics_prom: str = None
+
+    # records the requests sent to the Kubernetes API when exporting metrics (see: k8v.metrics)
+    metrics = None
+
     # namespaces to search
     namespaces: list = dataclasses.field(default_factory=list)
 
@@ -38,32 +74,88 @@ class Config:
 
     formatter = None
 
+    # request compressed (gzip) responses from the Kubernetes API
+    gzip: bool = False
+
+    # maximum number of resources to request per page (0 = unlimited)
+    page_size: int = 500
+
+    # maximum number of connections to the Kubernetes API kept open (0 = match parallel / max_inflight)
+    pool_size: int = 0
+
+    # phase to search for (ex: Running, Pending, Bound)
+    phase: str = None
+
+    # number of list calls to issue concurrently (1 = serial)
+    parallel: int = 1
+
+    # parse raw JSON responses instead of deserializing them into models
+    raw: bool = False
+
+    # ignore any cached list results (they are still updated)
+    refresh: bool = False
+
     # include related resources in results
     related: bool = False
 
+    # report the time spent in each phase of the search on STDERR
+    profile: bool = False
+
+    # format of the profiling report (text or json)
+    profile_format: str = "text"
+
+    # accumulates the time spent in each phase when profiling (see: k8v.profiler)
+    profiler = None
+
     # resource types
     resources: list = dataclasses.field(default_factory=list)
 
     # label selectors
     selectors: dict = dataclasses.field(default_factory=dict)
 
+    # file (or directory of files) saved using the pickle output to search instead of the cluster
+    snapshot: str = None
+
     # verbose logging
     verbose: bool = False
 
+    # keep watching for changes to the resources
+    watch: bool = False
+
+    def __post_init__(self):
+        self.profiler = k8v.profiler.Profiler(self)
+        self.metrics = k8v.metrics.Metrics(self)
+
+    @staticmethod
+    def compile_color_scheme(scheme: dict) -> dict:
+        """Resolve the ANSI codes of each key in the color scheme once into (prefix, suffix) strings."""
+        if scheme is None:
+            return None
+        sources = {"fg": fg, "bg": bg, "fx": fx}
+        return {
+            key: (
+                "".join(str(getattr(sources[src], name)) for src, name in codes),
+                str(fx.reset),
+            )
+            for key, codes in scheme.items()
+        }
+
     def load(self):
-        # determine how to write to our output (Pickle is binary)
+        # determine how to write to our output (Pickle and snapshots are binary)
         if self.filename is not None:
-            if self.output in ["pickle", "p"]:
+            if self.output in ["pickle", "p", "snapshot"]:
                 self.file = open(self.filename, "wb")
             else:
                 self.file = open(self.filename, "w")
+        elif self.output == "snapshot":
+            raise Exception("snapshot output requires a file (-f)")
         try:
-            schemes = json.load(open("etc/color-schemes.json"))["schemes"]
+            schemes = k8v.registry.load_data("color-schemes.json")["schemes"]
             if self.colors in schemes:
                 self.color_scheme = schemes[self.colors]
             else:
                 self.color_scheme = None
-            self.handlers = json.load(open("etc/handlers.json"))
+            self.color_templates = self.compile_color_scheme(self.color_scheme)
         except Exception as e:
             print(f"Exception occurred loading color schemes: {e}")
             raise e
@@ -94,12 +186,19 @@ class Config:
                 k8v.resource_types.ResourceType.STATEFUL_SETS,
             ]
 
-        # setup the formatter to use
+        # setup the formatter to use (only the selected formatter's module is imported)
         if self.output in ["brief", "b"]:
-            self.formatter = k8v.formatters.brief_formatter.BriefFormatter(self)
+            module, name = "brief_formatter", "BriefFormatter"
         elif self.output in ["json", "j"]:
-            self.formatter = k8v.formatters.json_formatter.JsonFormatter(self)
+            module, name = "json_formatter", "JsonFormatter"
+        elif self.output == "ndjson":
+            module, name = "ndjson_formatter", "NdjsonFormatter"
         elif self.output in ["pickle", "p"]:
-            self.formatter = k8v.formatters.pickle_formatter.PickleFormatter(self)
+            module, name = "pickle_formatter", "PickleFormatter"
+        elif self.output == "snapshot":
+            module, name = "snapshot_formatter", "SnapshotFormatter"
         else:
-            self.formatter = k8v.formatters.default_formatter.DefaultFormatter(self)
+            module, name = "default_formatter", "DefaultFormatter"
+        module = importlib.import_module(f"k8v.formatters.{module}")
+        self.formatter = getattr(module, name)(self)
+        self.compact = self.formatter.compact
@@ -0,0 +1,22 @@
+"""Fast JSON parsing and serialization using orjson when it is available."""
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback when orjson is not installed
+    orjson = None
+
+import json
+
+
+def loads(data):
+    """Parse a JSON document (str or bytes) into plain Python objects."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Serialize plain Python objects into a JSON document."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
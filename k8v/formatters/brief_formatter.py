@@ -6,6 +6,8 @@ from k8v.formatters.formatter import FormatterBase
 class BriefFormatter(FormatterBase):
     """The Printer that is used for the *brief* output type."""
 
+    compact = True
+
     def print(self, resource, delim: str) -> None:
         """Print out a resources and its information along with related resources."""
         message = io.StringIO("")
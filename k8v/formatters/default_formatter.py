@@ -1,6 +1,3 @@
-import jsons
-from io import StringIO
-
 from k8v.resource_types import ResourceType
 from k8v.formatters.formatter import FormatterBase
 
@@ -8,6 +5,18 @@ from k8v.formatters.formatter import FormatterBase
 class DefaultFormatter(FormatterBase):
     """The Printer that is used by default."""
 
+    compact = True
+
+    def __init__(self, config):
+        super().__init__(config)
+
+        # resolve the format_<type> method (if any) used for each ResourceType once
+        self.formatters = {
+            type: getattr(self, f"format_{type.value[0]}")
+            for type in ResourceType
+            if hasattr(self, f"format_{type.value[0]}")
+        }
+
     def format(self, name, value, **kwargs):
         # defaults for kwargs
         if "key" not in kwargs:
@@ -17,12 +26,15 @@ class DefaultFormatter(FormatterBase):
         if "end" not in kwargs:
             kwargs["end"] = ""
 
-        msg: StringIO = StringIO("")
-        msg.write(self.get_text(f"{kwargs['key']}_name", name))
-        msg.write(self.get_text(f"{kwargs['key']}_delim", kwargs["start"]))
-        msg.write(self.get_text(f"{kwargs['key']}_value", str(value)))
-        msg.write(self.get_text(f"{kwargs['key']}_delim", kwargs["end"]))
-        return msg.getvalue()
+        key = kwargs["key"]
+        return "".join(
+            (
+                self.get_text(f"{key}_name", name),
+                self.get_text(f"{key}_delim", kwargs["start"]),
+                self.get_text(f"{key}_value", str(value)),
+                self.get_text(f"{key}_delim", kwargs["end"]),
+            )
+        )
 
     def format_clusterrole(self, cr):
         pairs: list = list()
@@ -228,25 +240,21 @@ class DefaultFormatter(FormatterBase):
 
     def print(self, resource, delim="") -> None:
         """Print the **default** display version of a resource."""
-        details = StringIO("")
+        parts: list = [delim, self.get_text("type", resource.type.value[0]), "/"]
+        if resource.metadata.namespace:
+            parts.append(self.get_text("namespace", resource.metadata.namespace))
+            parts.append("/")
+        parts.append(self.get_text("name", resource.metadata.name))
+        parts.append(" (")
 
         # write common things first
-        details.write(self.format_labels(resource))
+        parts.append(self.format_labels(resource))
         if hasattr(resource, "spec") and hasattr(resource.spec, "service_account"):
-            details.write(self.format("sa", resource.spec.service_account) + " ")
+            parts.append(self.format("sa", resource.spec.service_account) + " ")
 
         # Use format_<type> methods if they exist
-        if hasattr(self, f"format_{resource.type.value[0]}"):
-            details.write(getattr(self, f"format_{resource.type.value[0]}")(resource))
-
-        type_text = self.get_api_type(resource.__class__.__name__)
-        message = StringIO("")
-        message.write(delim)
-        message.write(self.get_text("type", resource.type.value[0]))
-        message.write("/")
-        if resource.metadata.namespace:
-            message.write(self.get_text("namespace", resource.metadata.namespace))
-            message.write("/")
-        message.write(self.get_text("name", resource.metadata.name))
-        message.write(" ")
-        self.config.file.write(f"{message.getvalue()}({details.getvalue()})")
+        formatter = self.formatters.get(resource.type)
+        if formatter is not None:
+            parts.append(formatter(resource))
+        parts.append(")")
+        self.config.file.write("".join(parts))
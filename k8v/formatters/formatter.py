@@ -1,9 +1,6 @@
 import io
 from typing import Protocol
 
-from ansi.color import fg, bg
-import ansi.color.fx as fx
-
 
 import k8v
 
@@ -18,40 +15,28 @@ class Formatter(Protocol):
         """Stop displaying resources."""
 
     def begin_resource(self) -> None:
-        """Stop the Printer and cleanup anything if needed."""
+        """Start displaying a resource (ex: write a separator from the previous one)."""
 
-    def end_resource(self, last: bool) -> None:
-        """Stop the Printer and cleanup anything if needed."""
+    def end_resource(self) -> None:
+        """Stop displaying a resource and cleanup anything if needed."""
 
     def print(self, resource: object, delim: str) -> None:
         """Print the resources to the specified file."""
 
 
 class FormatterBase(Formatter):
+    # only the attributes displayed are needed (see: k8v.compact)
+    compact: bool = False
+
     def __init__(self, config: k8v.config.Config):
         self.config = config
 
     def begin_resource(self) -> None:
         pass
 
-    def end_resource(self, last: bool) -> None:
+    def end_resource(self) -> None:
         self.config.file.write("\n")
 
-    def get_api_type(self, api_type: str) -> str:
-        """Map the API class names to a more user friendly string to display.
-
-        Args:
-            api_type (str): Class name of the API object we need a friendly name for
-
-        Returns:
-            str: friendly name for the specified api_type
-        """
-        for k, v in self.config.handlers.items():
-            for t, d in v.items():
-                if "type" in d and d["type"] == api_type:
-                    return t
-        return None
-
     def get_pod_data(self, resource) -> [list, list]:
         """Get any related configmap or secrets related to this resource."""
 
@@ -88,19 +73,8 @@ class FormatterBase(Formatter):
         """Format a message with the specified text before resetting the ANSI code."""
 
         # work with no schema selected
-        if self.config.color_scheme == None:
+        if self.config.color_templates is None:
             return text
 
-        message = []
-        for data in self.config.color_scheme[key]:
-            src = None
-            if data[0] == "fg":
-                src = fg
-            elif data[0] == "bg":
-                src = bg
-            elif data[0] == "fx":
-                src = fx
-            message.append(getattr(src, data[1]))
-        message.append(text)
-        message.append(fx.reset)
-        return "".join(map(str, message))
+        prefix, suffix = self.config.color_templates[key]
+        return prefix + str(text) + suffix
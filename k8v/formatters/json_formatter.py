@@ -1,9 +1,6 @@
-import jsons
-
-from kubernetes.client.configuration import Configuration
-
+from k8v import fastjson, serializer
 from k8v.formatters.formatter import FormatterBase
-from k8v.resource_types import ResourceType
+from k8v.raw_resource import RawResource
 
 
 class JsonFormatter(FormatterBase):
@@ -11,28 +8,27 @@ class JsonFormatter(FormatterBase):
 
     def begin(self):
         """Force valid JSON by creating an *array* to represent all resources."""
-        jsons.set_serializer(lambda o, **_: "", Configuration)
-        jsons.set_serializer(lambda o, **_: "", ResourceType)
         self.config.file.write("[")
+        self.first = True
 
     def end(self):
-        self.config.file.write("]")
+        self.config.file.write("]" if self.first else "\n]")
+
+    def begin_resource(self):
+        """Separate each resource from the previous one so the total count is not needed."""
+        if not self.first:
+            self.config.file.write(",\n")
+        self.first = False
 
-    def end_resource(self, last: bool):
-        self.config.file.write("\n" if last else ",\n")
+    def end_resource(self):
+        pass
 
     def print(self, resource, delim: str = "") -> None:
         """Print the resource out as JSON."""
 
-        # TODO: strip out unwanted entries added by serialization (ex: local_configuration_vars)
-        text = delim + jsons.dumps(
-            resource,
-            strip_privates=True,
-            strip_nulls=False,
-            strip_class_variables=True,
-        )
-        self.config.file.write(text)
-
-    def print_next(self, last_one: bool) -> None:
-        """Print a comma between resources but not for the last one."""
-        self.config.file.write("\n" if last_one else ",\n")
+        # raw resources already have their JSON representation
+        if isinstance(resource, RawResource):
+            data = resource.to_dict()
+        else:
+            data = serializer.to_dict(resource)
+        self.config.file.write(delim + fastjson.dumps(data))
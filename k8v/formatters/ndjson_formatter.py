@@ -0,0 +1,25 @@
+from k8v.formatters.json_formatter import JsonFormatter
+
+
+class NdjsonFormatter(JsonFormatter):
+    """The Printer used to display results as newline delimited JSON (one resource per line)."""
+
+    def begin(self):
+        self.count = 0
+
+    def end(self):
+        self.config.file.flush()
+
+    def begin_resource(self):
+        pass
+
+    def end_resource(self):
+        """End each line and flush every page of resources so consumers can start processing them."""
+        self.config.file.write("\n")
+        self.count += 1
+        if self.config.page_size > 0 and self.count % self.config.page_size == 0:
+            self.config.file.flush()
+
+    def print(self, resource, delim: str = "") -> None:
+        """Print the resource out as a single line of JSON (related resources are not indented)."""
+        super().print(resource)
@@ -10,7 +10,7 @@ class PickleFormatter(FormatterBase):
     def end(self):
         self.config.file.close()
 
-    def end_resource(self, resource):
+    def end_resource(self):
         pass
 
     def print(self, resource, delim: str = "") -> None:
@@ -0,0 +1,20 @@
+from k8v.formatters.formatter import FormatterBase
+from k8v.snapshot import SnapshotWriter
+
+
+class SnapshotFormatter(FormatterBase):
+    """The Printer used to save results as an indexed snapshot (see: --from-snapshot)."""
+
+    def begin(self):
+        self.writer = SnapshotWriter(self.config.file)
+
+    def end(self):
+        self.writer.close()
+        self.config.file.close()
+
+    def end_resource(self):
+        pass
+
+    def print(self, resource, delim: str = "") -> None:
+        """Add the resource to the snapshot."""
+        self.writer.write(resource)
@@ -0,0 +1,45 @@
+import re
+
+
+class Matcher:
+    """A compiled predicate that evaluates all of the filtering criteria in a single pass per resource."""
+
+    def __init__(self, config):
+        self.includes = self.compile(config.includes)
+        self.excludes = self.compile(config.excludes)
+        self.selectors = list(config.selectors.items())
+        self.names = frozenset(config.names)
+        self.excluded_namespaces = frozenset(config.excluded_namespaces)
+        self.phase = config.phase
+
+    @staticmethod
+    def compile(patterns: list):
+        """Combine the substrings into a single regular expression matching any of them (None if empty)."""
+        if len(patterns) == 0:
+            return None
+        return re.compile("|".join(map(re.escape, patterns))).search
+
+    def matches(self, resource) -> bool:
+        """Check whether the resource passes every filter (includes match if any of them are found)."""
+        metadata = resource.metadata
+        if self.includes is not None and self.includes(metadata.name) is None:
+            return False
+        if self.selectors:
+            labels = getattr(metadata, "labels", None)
+            if labels is None:
+                return False
+            for label, value in self.selectors:
+                if label not in labels or labels[label] != value:
+                    return False
+        if self.names and metadata.name not in self.names:
+            return False
+        if self.excluded_namespaces and metadata.namespace in self.excluded_namespaces:
+            return False
+        if self.phase is not None and (
+            not hasattr(resource, "status")
+            or getattr(resource.status, "phase", None) != self.phase
+        ):
+            return False
+        if self.excludes is not None and self.excludes(metadata.name) is not None:
+            return False
+        return True
@@ -0,0 +1,191 @@
+import collections
+import json
+import threading
+
+# upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class CallMetrics:
+    """Totals for the list requests of a ResourceType in a namespace."""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "seconds",
+        "bytes",
+        "wire_bytes",
+        "items",
+        "watches",
+        "buckets",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.bytes = 0
+        self.wire_bytes = 0
+        self.items = 0
+        self.watches = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # the last one is +Inf
+
+
+class Metrics:
+    """Record the requests sent to the Kubernetes API (count, latency, response bytes and items).
+
+    Metrics are only recorded when they are exported using the --metrics or --metrics-prom options.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.calls: dict = collections.defaultdict(CallMetrics)
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.config.metrics_file is not None or self.config.metrics_prom is not None
+        )
+
+    def record(
+        self,
+        type,
+        namespace: str,
+        seconds: float,
+        bytes: int = 0,
+        items: int = 0,
+        wire_bytes: int = 0,
+        error: bool = False,
+    ) -> None:
+        """Record a single request (ex: a page of a list call).
+
+        The bytes are the size of the response body once decoded while the wire bytes are the size
+        received from the API server (smaller when the response is compressed).
+        """
+        bucket = len(LATENCY_BUCKETS)
+        for num, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                bucket = num
+                break
+
+        with self.lock:
+            call = self.calls[(type, namespace)]
+            call.requests += 1
+            call.errors += error
+            call.seconds += seconds
+            call.bytes += bytes
+            call.wire_bytes += wire_bytes
+            call.items += items
+            call.buckets[bucket] += 1
+
+    def add_items(self, type, namespace: str, items: int) -> None:
+        """Record the resources received in a response once it has been parsed."""
+        with self.lock:
+            self.calls[(type, namespace)].items += items
+
+    def record_watch(self, type, namespace: str, error: bool = False) -> None:
+        """Record a watch connection opened (or one that failed)."""
+        with self.lock:
+            call = self.calls[(type, namespace)]
+            if error:
+                call.errors += 1
+            else:
+                call.watches += 1
+
+    def summary(self) -> dict:
+        """Summarize the requests in total and for each ResourceType / namespace."""
+        calls: list = []
+        for (type, namespace), call in self.calls.items():
+            calls.append(
+                {
+                    "type": type.value[0],
+                    "namespace": namespace,
+                    "requests": call.requests,
+                    "errors": call.errors,
+                    "seconds": call.seconds,
+                    "bytes": call.bytes,
+                    "wire_bytes": call.wire_bytes,
+                    "items": call.items,
+                    "watches": call.watches,
+                    "latency": dict(
+                        zip([str(b) for b in LATENCY_BUCKETS] + ["+Inf"], call.buckets)
+                    ),
+                }
+            )
+
+        summary: dict = {
+            key: sum(call[key] for call in calls)
+            for key in [
+                "requests",
+                "errors",
+                "seconds",
+                "bytes",
+                "wire_bytes",
+                "items",
+                "watches",
+            ]
+        }
+
+        # ratio of the decoded to the received size of the responses (ex: 8.0 when using --gzip)
+        summary["compression"] = (
+            summary["bytes"] / summary["wire_bytes"] if summary["wire_bytes"] else None
+        )
+        summary["calls"] = calls
+        return summary
+
+    def prometheus(self) -> str:
+        """Format the metrics using the Prometheus text exposition format."""
+        lines: list = []
+        counters = [
+            ("requests", "k8v_api_requests_total", "List requests sent"),
+            (
+                "errors",
+                "k8v_api_request_errors_total",
+                "List requests (and watches) that failed",
+            ),
+            ("bytes", "k8v_api_response_bytes_total", "Bytes received in responses"),
+            (
+                "wire_bytes",
+                "k8v_api_response_wire_bytes_total",
+                "Bytes received (before decompression) in responses",
+            ),
+            (
+                "items",
+                "k8v_api_response_items_total",
+                "Resources received in responses",
+            ),
+            ("watches", "k8v_api_watches_total", "Watch connections opened"),
+        ]
+        for attr, name, help in counters:
+            lines.append(f"# HELP {name} {help} to the Kubernetes API.")
+            lines.append(f"# TYPE {name} counter")
+            for labels, call in self.labeled_calls():
+                lines.append(f"{name}{{{labels}}} {getattr(call, attr)}")
+
+        name = "k8v_api_request_duration_seconds"
+        lines.append(
+            f"# HELP {name} Latency of the list requests to the Kubernetes API."
+        )
+        lines.append(f"# TYPE {name} histogram")
+        for labels, call in self.labeled_calls():
+            count = 0
+            for bound, bucket in zip(list(LATENCY_BUCKETS) + ["+Inf"], call.buckets):
+                count += bucket
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {call.seconds}")
+            lines.append(f"{name}_count{{{labels}}} {call.requests}")
+        return "\n".join(lines) + "\n"
+
+    def labeled_calls(self):
+        for (type, namespace), call in self.calls.items():
+            yield f'type="{type.value[0]}",namespace="{namespace or ""}"', call
+
+    def export(self) -> None:
+        """Write the metrics to the file(s) requested."""
+        if self.config.metrics_file is not None:
+            with open(self.config.metrics_file, "w") as f:
+                json.dump(self.summary(), f, indent=2)
+        if self.config.metrics_prom is not None:
+            with open(self.config.metrics_prom, "w") as f:
+                f.write(self.prometheus())
@@ -0,0 +1,52 @@
+from k8v.resource_types import ResourceType
+
+
+class QueryPlanner:
+    """The QueryPlanner determines which search criteria can be applied by the API server.
+
+    Criteria that can be expressed as label or field selectors are sent along with the list calls
+    so the API server only returns matching resources. Everything else (ex: substring matches on
+    names) is left to the client-side filtering in the Searcher, which is always applied as well.
+    """
+
+    # resource types which support filtering on their phase by the API server
+    PHASE_TYPES = [ResourceType.PODS]
+
+    def __init__(self, config):
+        self.config = config
+
+    def get_label_selector(self) -> str:
+        """Combine the label selectors into an expression that can be sent to the API server."""
+        return ",".join(
+            f"{label}={value}" for label, value in self.config.selectors.items()
+        )
+
+    def get_field_selector(self, type: ResourceType) -> str:
+        """Build a field selector expression from any criteria the API server can evaluate."""
+        fields: list = []
+
+        # only a single exact name can be expressed since field selectors cannot be OR'ed
+        if len(self.config.names) == 1:
+            fields.append(f"metadata.name={self.config.names[0]}")
+
+        if self.config.namespaces is None:
+            for ns in self.config.excluded_namespaces:
+                fields.append(f"metadata.namespace!={ns}")
+
+        if self.config.phase is not None and type in self.PHASE_TYPES:
+            fields.append(f"status.phase={self.config.phase}")
+
+        return ",".join(fields)
+
+    def plan(self, type: ResourceType) -> dict:
+        """Determine the keyword arguments for the list calls used to search for the specified type."""
+        kwargs: dict = {}
+
+        label_selector = self.get_label_selector()
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+
+        field_selector = self.get_field_selector(type)
+        if field_selector:
+            kwargs["field_selector"] = field_selector
+        return kwargs
@@ -0,0 +1,152 @@
+import collections
+import json
+import threading
+import time
+
+
+class PhaseStats:
+    """Totals accumulated for a phase (and ResourceType)."""
+
+    __slots__ = ("calls", "wall", "cpu", "bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.bytes = 0
+
+
+class Phase:
+    """Time a single call of a phase (wall clock and CPU time of the current thread).
+
+    Only the time spent in the phase itself is recorded: the time of any phases nested within it
+    (ex: the API requests listing the candidates of a related lookup) is recorded for those.
+    """
+
+    __slots__ = ("profiler", "key", "bytes", "wall", "cpu", "nested_wall", "nested_cpu")
+
+    def __init__(self, profiler, key: tuple):
+        self.profiler = profiler
+        self.key = key
+        self.bytes = 0
+        self.nested_wall = 0.0
+        self.nested_cpu = 0.0
+
+    def __enter__(self):
+        self.profiler.get_stack().append(self)
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *args):
+        wall = time.perf_counter() - self.wall
+        cpu = time.thread_time() - self.cpu
+        stack = self.profiler.get_stack()
+        stack.pop()
+        if stack:
+            stack[-1].nested_wall += wall
+            stack[-1].nested_cpu += cpu
+        self.profiler.add(
+            self.key, wall - self.nested_wall, cpu - self.nested_cpu, self.bytes
+        )
+
+    def add_bytes(self, count: int) -> None:
+        self.bytes += count
+
+
+class NullPhase:
+    """Phase used when profiling is disabled so instrumented code has (almost) no overhead."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def add_bytes(self, count: int) -> None:
+        pass
+
+
+NULL_PHASE = NullPhase()
+
+
+class Profiler:
+    """Accumulate the wall time, CPU time, calls and bytes of each phase of a search per ResourceType.
+
+    Profiling is only enabled with the --profile option, otherwise each phase is a no-op.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.stats: dict = collections.defaultdict(PhaseStats)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def get_stack(self) -> list:
+        """Retrieve the phases currently timed by the current thread (innermost last)."""
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        return self.local.stack
+
+    def phase(self, name: str, type=None):
+        """Retrieve a context manager timing a call of the phase (ex: with profiler.phase("api", type):)."""
+        if not self.config.profile:
+            return NULL_PHASE
+        return Phase(self, (name, type))
+
+    def wrap(self, name: str, type, fn):
+        """Wrap a function called many times (ex: per resource) so each call is timed as the phase."""
+        if not self.config.profile:
+            return fn
+
+        def timed(*args, **kwargs):
+            with Phase(self, (name, type)):
+                return fn(*args, **kwargs)
+
+        return timed
+
+    def record(self, name: str, type, wall: float, bytes: int = 0) -> None:
+        """Record a call of the phase timed by the caller, without any CPU time.
+
+        Used for requests awaited on an event loop (see: --async): the thread runs other tasks while
+        they are in flight so only the elapsed time of each request is meaningful.
+        """
+        if self.config.profile:
+            self.add((name, type), wall, 0.0, bytes)
+
+    def add(self, key: tuple, wall: float, cpu: float, bytes: int = 0) -> None:
+        with self.lock:
+            stats = self.stats[key]
+            stats.calls += 1
+            stats.wall += wall
+            stats.cpu += cpu
+            stats.bytes += bytes
+
+    def results(self) -> list:
+        """Retrieve the totals of each phase and ResourceType in the order they first occurred."""
+        return [
+            {
+                "phase": name,
+                "type": None if type is None else type.value[0],
+                "calls": stats.calls,
+                "wall": stats.wall,
+                "cpu": stats.cpu,
+                "bytes": stats.bytes,
+            }
+            for (name, type), stats in self.stats.items()
+        ]
+
+    def report(self, file) -> None:
+        """Write the results as a table (or as JSON with --profile-format=json)."""
+        results = self.results()
+        if self.config.profile_format == "json":
+            file.write(json.dumps(results, indent=2) + "\n")
+            return
+
+        file.write(
+            f"{'phase':<12} {'type':<22} {'calls':>8} {'wall (s)':>10} {'cpu (s)':>10} {'bytes':>12}\n"
+        )
+        for r in results:
+            file.write(
+                f"{r['phase']:<12} {r['type'] or '-':<22} {r['calls']:>8} {r['wall']:>10.3f} {r['cpu']:>10.3f} {r['bytes']:>12}\n"
+            )
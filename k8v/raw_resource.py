@@ -0,0 +1,64 @@
+class RawResource:
+    """A lightweight view of a resource parsed from the raw JSON returned by the API server.
+
+    The view exposes the same (snake_case) attributes as the generated kubernetes.client model
+    it wraps by using the model's attribute_map / openapi_types. Nested values are only wrapped
+    when they are accessed, which avoids deserializing the parts of a resource that are never
+    displayed.
+    """
+
+    PRIMITIVE_TYPES = ["str", "int", "float", "bool", "date", "datetime", "object"]
+
+    # cache of model classes resolved by name
+    _models: dict = {}
+
+    def __init__(self, data: dict, model: type):
+        self._data = data
+        self._model = model
+
+    def __getattr__(self, name: str):
+        # never resolve private attributes (ex: during unpickling)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self._model.attribute_map:
+            raise AttributeError(name)
+
+        value = RawResource.wrap(
+            self._data.get(self._model.attribute_map[name]),
+            self._model.openapi_types[name],
+        )
+        self.__dict__[name] = value  # only wrap each attribute once
+        return value
+
+    @staticmethod
+    def get_model(name: str) -> type:
+        """Retrieve the kubernetes.client model class with the specified name."""
+        if name not in RawResource._models:
+            import kubernetes.client.models
+
+            RawResource._models[name] = getattr(kubernetes.client.models, name)
+        return RawResource._models[name]
+
+    @staticmethod
+    def wrap(value, type_name: str):
+        """Wrap a raw JSON value according to the specified OpenAPI type."""
+        if value is None or type_name in RawResource.PRIMITIVE_TYPES:
+            return value
+        if type_name.startswith("list["):
+            return [RawResource.wrap(v, type_name[5:-1]) for v in value]
+        if type_name.startswith("dict("):
+            value_type = type_name[type_name.index(",") + 1 : -1].strip()
+            if value_type in RawResource.PRIMITIVE_TYPES:
+                return value
+            return {k: RawResource.wrap(v, value_type) for k, v in value.items()}
+        return RawResource(value, RawResource.get_model(type_name))
+
+    def to_dict(self) -> dict:
+        """Retrieve the raw JSON data for the resource including its apiVersion and kind."""
+        data: dict = {}
+        if "apiVersion" in self.__dict__:
+            data["apiVersion"] = self.apiVersion
+        if "kind" in self.__dict__:
+            data["kind"] = self.kind
+        data.update(self._data)
+        return data
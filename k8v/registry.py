@@ -0,0 +1,53 @@
+import collections
+import functools
+import json
+import os
+
+from k8v.resource_types import ResourceType
+
+# data files (ex: handlers.json) packaged with k8v so it works from any directory
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# functions used to list a ResourceType in all namespaces / a single namespace and its model class name
+Handler = collections.namedtuple("Handler", ["all", "ns", "model_type"])
+
+
+def load_data(filename: str):
+    """Load one of the JSON data files packaged with k8v."""
+    with open(os.path.join(DATA_DIR, filename)) as f:
+        return json.load(f)
+
+
+class HandlerRegistry:
+    """Map each ResourceType to the API group (ex: AppsV1Api) and functions used to list it."""
+
+    def __init__(self, handler_config: dict):
+        self.handler_config = handler_config
+
+        # group, handler data for each supported ResourceType
+        self.types: dict = {}
+        for group, data in handler_config.items():
+            for name, handler in data.items():
+                type = ResourceType.from_value(name)
+                if type is not None and "all" in handler:
+                    self.types[type] = (group, handler)
+
+    def bind(self, create_api) -> dict:
+        """Create each API group once using create_api(group) and bind the list functions for each ResourceType."""
+        apis: dict = {}
+        handlers: dict = {}
+        for type, (group, handler) in self.types.items():
+            if group not in apis:
+                apis[group] = create_api(group)
+            handlers[type] = Handler(
+                getattr(apis[group], handler["all"]),
+                getattr(apis[group], handler["ns"], None) if "ns" in handler else None,
+                handler.get("type"),
+            )
+        return handlers
+
+
+@functools.lru_cache(maxsize=None)
+def get_registry() -> HandlerRegistry:
+    """Retrieve the registry for the handlers packaged with k8v (loaded once)."""
+    return HandlerRegistry(load_data("handlers.json"))
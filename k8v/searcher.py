@@ -1,7 +1,13 @@
-import kubernetes
+import concurrent.futures
 import collections
-import json
-
+import itertools
+
+from k8v.backends.kubernetes_backend import KubernetesBackend
+from k8v.backends.snapshot_backend import SnapshotBackend
+from k8v.cache import ListCache
+from k8v.compact import compact
+from k8v.matcher import Matcher
+from k8v.planner import QueryPlanner
 from k8v.resource_types import ResourceType
 
 
@@ -9,140 +15,214 @@ class Searcher:
     def __init__(self, viewer):
         self.viewer = viewer
         self.config = viewer.config
-        self._handlers = {}
+        self.backend = KubernetesBackend(self.config)
+        self._executor = None
+        self._related = {}
+        self._owners = {}
+        self.cache = None
+        self.planner = QueryPlanner(self.config)
 
     def setup(self):
-        """Load the Kubernetes configuration and setup API endpoint connections."""
-        self._handler_config = json.load(open("etc/handlers.json"))
+        """Setup the backend used to retrieve resources (a live cluster or a snapshot)."""
+        self.setup_backend()
 
-        self.kubernetes_config = kubernetes.config.load_kube_config()
-        self.api_client = kubernetes.client.ApiClient(self.kubernetes_config)
+        # cache list results on disk for the current context if requested
+        if self.config.cache_ttl > 0 and self.backend.live:
+            self.cache = ListCache(
+                self.config, self.backend.get_context(), self.backend
+            )
 
-        for group, data in self._handler_config.items():
-            if hasattr(kubernetes.client, group):
-                self._handlers[group] = getattr(kubernetes.client, group)(
-                    self.api_client
-                )
-            else:
-                raise Exception(f"invalid resource handler{group}")
+        self.setup_executor()
 
-    def filter_resources(self, resources):
-        """Apply filtering logic to the specified resources."""
+    def setup_backend(self):
+        if self.config.snapshot is not None:
+            self.backend = SnapshotBackend(self.config)
+        self.backend.setup()
 
-        # fitler by "includes" first
-        for include in self.config.includes:
-            resources = filter(lambda x: include in x.metadata.name, resources)
-
-        # filter by label "selectors" next
-        for label, value in self.config.selectors.items():
-            resources = filter(
-                lambda x: x.metadata.labels is not None
-                and label in x.metadata.labels
-                and x.metadata.labels[label] == value,
-                resources,
-            )
+    def close(self):
+        """Release the resources used for searching (ex: the worker pool)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
-        # exclude anything undesirable lastly
-        for exclude in self.config.excludes:
-            resources = filter(lambda x: exclude not in x.metadata.name, resources)
-        return resources
+    def setup_executor(self):
+        """Use a bounded pool of workers to issue list calls concurrently if requested."""
+        if self.config.parallel > 1:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.config.parallel
+            )
 
-    def get_api_handler(self, type: ResourceType) -> str:
-        """Retrieve the API handler function to use for the specified namespace(s) and ResourceType."""
-
-        # do we understand this resource type?
-        for group, data in self._handler_config.items():
-            if type.value[0] in data:
-                # return the "all" or "namespace" specific handler as needed
-                if self.config.namespaces is None:
-                    return getattr(self._handlers[group], data[type.value[0]]["all"])
-                elif data[type.value[0]].get("ns") and hasattr(
-                    self._handlers[group], data[type.value[0]]["ns"]
-                ):
-                    return getattr(self._handlers[group], data[type.value[0]]["ns"])
-                else:
-                    return None
-        return None
+    def filter_resources(self, resources, type: ResourceType = None):
+        """Apply filtering logic to the specified resources."""
+        return filter(Matcher(self.config).matches, resources)
+
+    def get_api_handler(self, type: ResourceType):
+        """Retrieve the handler the backend uses to list resources of the specified ResourceType."""
+        return self.backend.get_api_handler(type)
+
+    def get_related_candidates(self, type: ResourceType) -> list:
+        """Retrieve every resource of the specified type once so related lookups can be joined in memory."""
+        if type not in self._related:
+            self._related[type] = self.search(type)
+        return self._related[type]
+
+    def get_owner_index(self, type: ResourceType) -> dict:
+        """Index every resource of the specified type by the uid of each of its owners."""
+        if type not in self._owners:
+            index: dict = collections.defaultdict(list)
+            for resource in self.get_related_candidates(type):
+                for owner in resource.metadata.owner_references or []:
+                    index[owner.uid].append(resource)
+            self._owners[type] = index
+        return self._owners[type]
+
+    def get_selector(self, resource) -> dict:
+        """Determine the labels a related resource must have to be selected by the specified resource."""
+        if hasattr(resource, "spec") and hasattr(resource.spec, "selector"):
+            selector = resource.spec.selector
+            # match_expressions are ignored since we cannot easily evaluate them right now
+            if hasattr(selector, "match_labels") and selector.match_labels is not None:
+                return selector.match_labels
+            return {}
+        elif resource.metadata.labels is not None:
+            return resource.metadata.labels
+        return {}
+
+    def is_selected(self, resource, namespace: str, selector: dict) -> bool:
+        """Determine if the resource lives in the namespace and has all of the selector labels."""
+        if resource.metadata.namespace != namespace:
+            return False
+        labels = resource.metadata.labels or {}
+        for label, value in selector.items():
+            if labels.get(label) != value:
+                return False
+        return True
 
     def search_for_related(self, resource, type: ResourceType) -> list:
-        """Search for any related resources of the given type."""
+        """Search for any related resources of the given type.
+
+        Related resources are selected from a single list of each child type which is shared by
+        every parent, so the number of API calls does not grow with the number of parents. Pods
+        are matched to their controllers using their ownerReferences.
+        """
 
         if not self.config.related:
             return []
 
-        resources: list = []
-        label_expr: str = ""
-
-        if hasattr(resource, "spec") and hasattr(resource.spec, "selector"):
-            selector = resource.spec.selector
-            if (
-                hasattr(selector, "match_expressions")
-                and selector.match_expressions is not None
-                and len(selector.match_expressions) > 0
-            ):
-                pass  # ignore since we cannot easily evaluate right now
-            if hasattr(selector, "match_labels"):
-                label_count: int = len(selector.match_labels) - 1
-                for num, label in enumerate(selector.match_labels.items()):
-                    label_expr += label[0] + "=" + label[1]
-                    if num < label_count:
-                        label_expr += ","
-        elif resource.metadata.labels is not None and len(resource.metadata.labels) > 0:
-            for num, label in enumerate(resource.metadata.labels):
-                label_expr += label + "=" + resource.metadata.labels[label]
-                if num < len(resource.metadata.labels) - 1:
-                    label_expr += ","
-
         if type == ResourceType.DEPLOYMENTS:
-            resources = self.search(
-                ResourceType.REPLICA_SETS, label_selector=label_expr
+            selector = self.get_selector(resource)
+            return [
+                x
+                for x in self.get_related_candidates(ResourceType.REPLICA_SETS)
+                if self.is_selected(x, resource.metadata.namespace, selector)
+            ]
+        elif type in [
+            ResourceType.DAEMON_SETS,
+            ResourceType.JOBS,
+            ResourceType.REPLICA_SETS,
+            ResourceType.STATEFUL_SETS,
+        ]:
+            return self.get_owner_index(ResourceType.PODS).get(
+                resource.metadata.uid, []
             )
-        elif type == ResourceType.DAEMON_SETS:
-            resources = self.search(ResourceType.PODS, label_selector=label_expr)
-        elif type == ResourceType.REPLICA_SETS:
-            resources = self.search(ResourceType.PODS, label_selector=label_expr)
-        elif type == ResourceType.STATEFUL_SETS:
-            resources = filter(
-                lambda x: resource.metadata.name in x.metadata.name,
-                self.search(ResourceType.PODS),
-            )
-        return resources
+        return []
+
+    def map_calls(self, fn, items: list):
+        """Apply fn to each item using the worker pool (if enabled) and iterate the results in order."""
+        if self._executor is None:
+            return map(fn, items)
+        return self._executor.map(fn, items)
+
+    def list_resources(
+        self, type: ResourceType, handler, namespace: str = None, **kwargs
+    ):
+        """Yield the annotated resources returned by a list call (from the cache if enabled)."""
+        if self.cache is None:
+            return self.fetch_resources(type, handler, namespace, **kwargs)
+        return self.cache.list(self.fetch_resources, type, handler, namespace, **kwargs)
+
+    def fetch_resources(
+        self, type: ResourceType, handler, namespace: str = None, **kwargs
+    ):
+        """Yield the annotated resources for a list call from the backend and return the list's resourceVersion."""
+        return (
+            yield from self.backend.fetch_resources(type, handler, namespace, **kwargs)
+        )
 
     def search(self, type: ResourceType, **kwargs) -> list:
         """Search for matching resources for the specified type."""
-        resources = []
-
-        # deterine which API handler to use
-        handler = self.get_api_handler(type)
-        if handler is None:
-            return resources
-
-        try:
-            if self.config.verbose:
-                print(f"Searching for {type.value[0]}")
-
-            if self.config.namespaces is None:
-                api_response = handler(**kwargs)
-                for d in api_response.items:
-                    d.type = type
-                    d.apiVersion = api_response.api_version
-                    d.kind = api_response.kind.replace("List", "")
-                    d._related = self.search_for_related(d, type)
-                    resources.append(d)
-            else:
-                for ns in self.config.namespaces:
-                    api_response = handler(ns, **kwargs)
-                    for d in api_response.items:
-                        d.type = type
-                        d.apiVersion = api_response.api_version
-                        d.kind = api_response.kind.replace("List", "")
-                        d._related = self.search_for_related(d, type)
-                        resources.append(d)
-        except Exception as e:
-            print(
-                f"Exeception occurred while searching for resources ({type.value[0]}): {e}"
-            )
-            raise e
+        return next(self.search_all([type], filtered=False, **kwargs))
+
+    def search_all(self, types: list, filtered: bool = True, **kwargs):
+        """Search for resources of each of the specified types and yield a list of results per type.
+
+        Every list call (type x namespace) is issued up front so they can run concurrently when
+        the worker pool is enabled, the results are merged back in the order they were requested.
+        Filtering is applied to each page as it arrives so only matching resources are kept, and
+        the results for each type are yielded as soon as all of its list calls have completed.
+        Top-level searches let the API server apply any criteria it can (see: QueryPlanner).
+        """
+
+        calls = self.get_calls(types, filtered, **kwargs)
+        responses = self.map_calls(
+            lambda call: self.collect(call, filtered), [c for cs in calls for c in cs]
+        )
+
+        # merge the responses back together in the order they were requested
+        for type, type_calls in zip(types, calls):
+            resources: list = []
+            for n in range(len(type_calls)):
+                resources.extend(next(responses))
+            yield self.complete(type, resources)
+
+    def get_calls(self, types: list, filtered: bool = True, **kwargs) -> list:
+        """Determine the list calls (type, handler, namespace, params) needed for each of the types."""
+        calls: list = []
+        for type in types:
+            handler = self.get_api_handler(type)
+            if handler is None:
+                calls.append([])
+                continue
+            namespaces = self.config.namespaces
+            if namespaces is None:
+                namespaces = [None]
+            params = dict(kwargs)
+            if filtered:
+                params.update(self.planner.plan(type))
+            calls.append([(type, handler, ns, params) for ns in namespaces])
+        return calls
+
+    def collect(self, call: tuple, filtered: bool = True) -> list:
+        """Issue a list call and collect the resources (that match the filters if requested).
+
+        The resources are prepared a page at a time as they arrive so only those kept are held.
+        """
+        resources = self.list_resources(*call[:3], **call[3])
+        collected: list = []
+        while True:
+            batch = list(itertools.islice(resources, self.config.page_size or None))
+            if not batch:
+                return collected
+            collected.extend(self.prepare(call[0], batch, filtered))
+
+    def prepare(self, type: ResourceType, resources: list, filtered: bool) -> list:
+        """Prepare a batch of resources for display: compact them (see: compact) and filter them if requested.
+
+        When the formatter only displays a few attributes each resource is replaced by a compact
+        record of them. Each step is timed once per batch when profiling.
+        """
+        profiler = self.config.profiler
+        if self.config.compact:
+            with profiler.phase("compact", type):
+                resources = [compact(d) for d in resources]
+        if filtered:
+            with profiler.phase("filter", type):
+                resources = list(self.filter_resources(resources, type))
+        return resources
 
-        # sort the resources by their names and return them
+    def complete(self, type: ResourceType, resources: list) -> list:
+        """Add the related resources to each of the resources of a type and sort them by their names."""
+        with self.config.profiler.phase("related", type):
+            for d in resources:
+                d._related = self.search_for_related(d, type)
         return sorted(resources, key=lambda x: x.metadata.name)
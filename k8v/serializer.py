@@ -0,0 +1,69 @@
+"""Convert kubernetes.client models into the same JSON compatible objects returned by the Kubernetes API."""
+
+import datetime
+
+from k8v.resource_types import ResourceType
+
+# values that are already JSON compatible
+PRIMITIVE_TYPES = (str, int, float, bool)
+
+# cache of (attribute, JSON key) pairs to serialize for each model class
+_plans: dict = {}
+
+
+def get_plan(model: type) -> tuple:
+    """Retrieve the attributes of a model class and the camelCase keys used for them by the API."""
+    plan = _plans.get(model)
+    if plan is None:
+        plan = tuple(
+            (name, model.attribute_map[name]) for name in model.openapi_types.keys()
+        )
+        _plans[model] = plan
+    return plan
+
+
+def to_dict(resource) -> dict:
+    """Serialize a resource with its apiVersion and kind first (as kubectl does)."""
+    data: dict = {}
+
+    # items of a list response have their apiVersion added by the backend
+    api_version = getattr(resource, "api_version", None) or getattr(
+        resource, "apiVersion", None
+    )
+    if api_version is not None:
+        data["apiVersion"] = api_version
+    kind = getattr(resource, "kind", None)
+    if kind is not None:
+        data["kind"] = kind
+
+    data.update(serialize(resource))
+    return data
+
+
+def serialize(value):
+    """Convert a value into JSON compatible objects, omitting any unset (None) attributes of models."""
+    if value is None or isinstance(value, PRIMITIVE_TYPES):
+        return value
+    if isinstance(value, list) or isinstance(value, tuple):
+        return [serialize(v) for v in value]
+    if isinstance(value, dict):
+        return {k: serialize(v) for k, v in value.items()}
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None and value.utcoffset() == datetime.timedelta(0):
+            return value.replace(tzinfo=None).isoformat() + "Z"
+        return value.isoformat()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if hasattr(value, "openapi_types"):
+        data: dict = {}
+        for name, key in get_plan(value.__class__):
+            v = getattr(value, name)
+            if isinstance(v, ResourceType):
+                # the model's own type field is replaced when listed (see: KubernetesBackend.annotate)
+                v = getattr(value, "_model_type", None)
+            if v is not None:
+                data[key] = serialize(v)
+        return data
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {value.__class__.__name__} is not serializable")
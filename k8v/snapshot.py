@@ -0,0 +1,120 @@
+import collections
+import mmap
+import pickle
+import struct
+
+from k8v.resource_types import ResourceType
+
+# identifies (and versions) the snapshot format
+MAGIC = b"K8VSNAP1"
+
+# magic, offset and length of the index (written last but stored first so readers can seek straight to it)
+HEADER = struct.Struct("<8sQQ")
+
+
+class SnapshotEntry:
+    """Index entry locating a single resource within a snapshot."""
+
+    __slots__ = ("type", "namespace", "name", "uid", "labels", "offset", "length")
+
+    def __init__(self, type, namespace, name, uid, labels, offset, length):
+        self.type = type
+        self.namespace = namespace
+        self.name = name
+        self.uid = uid
+        self.labels = labels
+        self.offset = offset
+        self.length = length
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+class SnapshotWriter:
+    """Write resources to a snapshot: a header, one pickle per resource and an index of the resources by type.
+
+    The file must be seekable since the header is updated with the location of the index once it is closed.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.index = collections.defaultdict(list)
+        self.uids = set()
+        self.file.write(HEADER.pack(MAGIC, 0, 0))
+        self.offset = HEADER.size
+
+    def write(self, resource) -> bool:
+        """Write the resource (without its related resources) unless it has already been written."""
+        key = (resource.type, resource.metadata.uid)
+        if key in self.uids:
+            return False
+        self.uids.add(key)
+
+        # related resources are written (and indexed) on their own
+        related = getattr(resource, "_related", None)
+        if related:
+            resource._related = []
+        try:
+            data = pickle.dumps(resource, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            if related:
+                resource._related = related
+
+        self.index[resource.type].append(
+            SnapshotEntry(
+                resource.type,
+                resource.metadata.namespace,
+                resource.metadata.name,
+                resource.metadata.uid,
+                dict(resource.metadata.labels or {}),
+                self.offset,
+                len(data),
+            )
+        )
+        self.file.write(data)
+        self.offset += len(data)
+        return True
+
+    def close(self) -> None:
+        """Write the index and point the header at it."""
+        data = pickle.dumps(dict(self.index), protocol=pickle.HIGHEST_PROTOCOL)
+        self.file.write(data)
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, self.offset, len(data)))
+        self.file.seek(0, 2)
+
+
+class SnapshotReader:
+    """Memory-map a snapshot and lazily load the resources located using its index."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, offset, length = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise Exception(f"invalid snapshot: {filename}")
+        self.index: dict = pickle.loads(self.data[offset : offset + length])
+
+    @staticmethod
+    def is_snapshot(filename: str) -> bool:
+        """Check whether the file is a snapshot (rather than a stream of pickled resources)."""
+        with open(filename, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+
+    def types(self) -> list:
+        return list(self.index.keys())
+
+    def entries(self, type: ResourceType) -> list:
+        return self.index.get(type, [])
+
+    def load(self, entry: SnapshotEntry):
+        """Deserialize the resource for an index entry."""
+        return pickle.loads(self.data[entry.offset : entry.offset + entry.length])
+
+    def close(self) -> None:
+        self.data.close()
@@ -1,3 +1,5 @@
+import sys
+
 import k8v
 
 
@@ -7,7 +9,13 @@ class Viewer:
     def __init__(self, config: k8v.config.Config = k8v.config.Config()) -> None:
         self.config: config.Config = config
         self.printer: k8v.printer.Printer = k8v.printer.Printer(self.config)
-        self.searcher: k8v.searcher.Searcher = k8v.searcher.Searcher(self)
+        self.searcher: k8v.searcher.Searcher = self.create_searcher()
+
+    def create_searcher(self) -> k8v.searcher.Searcher:
+        """Create the Searcher used to retrieve resources (scheduling list calls as asyncio tasks if requested)."""
+        if self.config.asynchronous and not self.config.watch:
+            return k8v.async_searcher.AsyncSearcher(self)
+        return k8v.searcher.Searcher(self)
 
     def view(self) -> None:
         """Use the input parameters to create a View of the desired resources and their relationships."""
@@ -19,14 +27,29 @@ class Viewer:
             )
 
         # Load configuration files
-        self.config.load()
-        self.searcher.setup()
-
-        # search for matching (and filtered) resources
-        resources = []
-        for type in self.config.resources:
-            for r in self.searcher.filter_resources(self.searcher.search(type)):
-                resources.append(r)
-
-        # use the Printer to print the results out as a group
-        self.printer.print_all(resources)
+        profiler = self.config.profiler
+        try:
+            with profiler.phase("load"):
+                self.config.load()
+            with profiler.phase("setup"):
+                self.searcher.setup()
+
+            # keep displaying changes to the resources if requested
+            if self.config.watch:
+                k8v.watcher.Watcher(self).watch()
+                return
+
+            # print the matching (and filtered) resources as each type is retrieved
+            self.printer.print_all(self.stream())
+        finally:
+            self.searcher.close()
+            if self.config.profile:
+                profiler.report(sys.stderr)
+            if self.config.metrics.enabled:
+                self.config.metrics.export()
+
+    def stream(self):
+        """Yield the matching resources for each type as soon as they have been retrieved."""
+        for resources in self.searcher.search_all(self.config.resources):
+            yield from resources
+            self.config.file.flush()
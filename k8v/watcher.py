@@ -0,0 +1,215 @@
+import queue
+import threading
+
+import kubernetes
+
+from k8v.backends.kubernetes_backend import KubernetesBackend
+from k8v.compact import compact
+from k8v.raw_resource import RawResource
+from k8v.resource_types import ResourceType
+
+
+class Watcher:
+    """The Watcher keeps an in-memory cache of resources up to date using watch events.
+
+    Each type (and namespace) is listed once and displayed as usual, then a thread per list call
+    watches for changes starting from the resourceVersion of the list. The events are applied
+    to the cache by the main thread and only the resources that changed are printed again (like
+    kubectl get --watch, deleted resources are printed one last time). If a watch expires (410
+    Gone) the resources are listed again and the differences are applied as events.
+    """
+
+    def __init__(self, viewer):
+        self.viewer = viewer
+        self.config = viewer.config
+        self.printer = viewer.printer
+        self.searcher = viewer.searcher
+        self.events: queue.Queue = queue.Queue()
+        self.resources: dict = {}
+
+    def get_key(self, type: ResourceType, resource) -> tuple:
+        return (type, resource.metadata.uid)
+
+    def list(self, type: ResourceType, handler, namespace: str, kwargs: dict) -> tuple:
+        """List the resources for a type (and namespace) and return them with the list's resourceVersion."""
+        resources: list = []
+        results = self.searcher.fetch_resources(type, handler, namespace, **kwargs)
+        while True:
+            try:
+                resources.append(next(results))
+            except StopIteration as stop:
+                return resources, stop.value
+
+    def prepare(self, type: ResourceType, resource):
+        """Filter a resource and prepare it for display, returning None if it should not be displayed."""
+        if len(list(self.searcher.filter_resources([resource]))) == 0:
+            return None
+        if self.config.compact:
+            resource = compact(resource)
+        resource._related = []
+        return resource
+
+    def apply(self, event: dict) -> None:
+        """Apply a watch event to the cache and print the resource if it changed."""
+        type = event["resource_type"]
+        if event["type"] == "RELIST":
+            for e in self.diff(type, event["namespace"], event["object"]):
+                self.apply(e)
+            return
+
+        key = self.get_key(type, event["object"])
+        resource = self.prepare(type, event["object"])
+        if event["type"] == "DELETED" or resource is None:
+            resource = self.resources.pop(key, None)
+        else:
+            # keep the related resources found for a resource when it is updated
+            cached = self.resources.get(key)
+            if cached is not None:
+                resource._related = cached._related
+            self.resources[key] = resource
+
+        if resource is not None:
+            self.printer.print(resource)
+            self.config.file.flush()
+
+    def diff(self, type: ResourceType, namespace: str, resources: list) -> list:
+        """Determine the events needed to bring the cache up to date with a new list of resources."""
+        events: list = []
+        current: dict = {}
+        for resource in resources:
+            key = self.get_key(type, resource)
+            current[key] = resource
+            cached = self.resources.get(key)
+            if (
+                cached is None
+                or cached.metadata.resource_version
+                != resource.metadata.resource_version
+            ):
+                events.append(
+                    {
+                        "type": "ADDED" if cached is None else "MODIFIED",
+                        "resource_type": type,
+                        "object": resource,
+                    }
+                )
+
+        for key, resource in self.resources.items():
+            if key[0] != type or key in current:
+                continue
+            if namespace is None or resource.metadata.namespace == namespace:
+                events.append(
+                    {"type": "DELETED", "resource_type": type, "object": resource}
+                )
+        return events
+
+    def get_resource(self, type: ResourceType, event: dict):
+        """Retrieve the annotated resource of a watch event (a RawResource in *raw* mode, like the list)."""
+        if self.config.raw:
+            data = event["raw_object"]
+            model = self.searcher.backend.get_model_type(type)
+            resource = RawResource(data, RawResource.get_model(model))
+            api_version, kind = data.get("apiVersion"), data.get("kind")
+        else:
+            resource = event["object"]
+            api_version, kind = resource.api_version, resource.kind
+        KubernetesBackend.annotate(resource, type, api_version, kind)
+        return resource
+
+    def stream(
+        self,
+        type: ResourceType,
+        handler,
+        namespace: str,
+        resource_version: str,
+        kwargs: dict,
+    ) -> None:
+        """Queue the watch events for a type (and namespace), listing them again if the watch expires."""
+        args: list = [] if namespace is None else [namespace]
+        try:
+            while True:
+                watch = kubernetes.watch.Watch()
+                if self.config.metrics.enabled:
+                    self.config.metrics.record_watch(type, namespace)
+                try:
+                    for event in watch.stream(
+                        handler, *args, resource_version=resource_version, **kwargs
+                    ):
+                        if event["type"] in ["ADDED", "MODIFIED", "DELETED"]:
+                            event["object"] = self.get_resource(type, event)
+                            event["resource_type"] = type
+                            self.events.put(event)
+                        resource_version = watch.resource_version
+                except kubernetes.client.rest.ApiException as e:
+                    if e.status != 410:
+                        raise e
+                    resources, resource_version = self.list(
+                        type, handler, namespace, kwargs
+                    )
+                    self.events.put(
+                        {
+                            "type": "RELIST",
+                            "resource_type": type,
+                            "namespace": namespace,
+                            "object": resources,
+                        }
+                    )
+        except Exception as e:
+            if self.config.metrics.enabled:
+                self.config.metrics.record_watch(type, namespace, error=True)
+            self.events.put({"type": "ERROR", "object": e})
+
+    def watch(self) -> None:
+        """Display the resources and then keep displaying any changes until interrupted."""
+        if not self.searcher.backend.live:
+            raise Exception("watching for changes requires a live cluster")
+        self.config.formatter.begin()
+
+        # list each type (and namespace) once to populate the cache
+        calls: list = []
+        for type in self.config.resources:
+            handler = self.searcher.get_api_handler(type)
+            if handler is None:
+                continue
+            kwargs = self.searcher.planner.plan(type)
+            namespaces = self.config.namespaces
+            if namespaces is None:
+                namespaces = [None]
+            for ns in namespaces:
+                calls.append((type, handler, ns, kwargs))
+
+        results = self.searcher.map_calls(lambda call: self.list(*call), calls)
+        for call, (resources, resource_version) in zip(calls, results):
+            for resource in resources:
+                resource = self.prepare(call[0], resource)
+                if resource is not None:
+                    self.resources[self.get_key(call[0], resource)] = resource
+
+            # start watching for changes from the resourceVersion of the list
+            threading.Thread(
+                target=self.stream,
+                args=(*call[:3], resource_version, call[3]),
+                daemon=True,
+            ).start()
+
+        # display the initial resources in the same order as a regular search
+        for type in self.config.resources:
+            resources = [r for k, r in self.resources.items() if k[0] == type]
+            for resource in sorted(resources, key=lambda x: x.metadata.name):
+                resource._related = self.searcher.search_for_related(resource, type)
+                self.printer.print(resource)
+        self.config.file.flush()
+
+        # apply the changes as they are received
+        try:
+            while True:
+                try:
+                    event = self.events.get(timeout=1)
+                except queue.Empty:
+                    continue
+                if event["type"] == "ERROR":
+                    raise event["object"]
+                self.apply(event)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.config.formatter.end()
@@ -0,0 +1,22 @@
+import pytest
+
+import app
+
+
+class TestApp:
+    """Validate the command line options are parsed (and rejected) as expected."""
+
+    @pytest.mark.parametrize(
+        "option",
+        ["--page-size", "--parallel", "--max-inflight", "--pool-size", "--cache-ttl"],
+    )
+    @pytest.mark.parametrize("value", ["0", "-1", "many"])
+    def test_invalid_count(self, capfd, option, value):
+        """Validate counts which are not positive integers are rejected with an error."""
+        with pytest.raises(SystemExit) as e:
+            app.main([option, value])
+        assert e.value.code == 2
+        assert (
+            f"ERROR: option {option} requires a positive integer (not '{value}')"
+            in capfd.readouterr().out
+        )
@@ -0,0 +1,324 @@
+import pytest
+import asyncio
+import gzip
+import io
+import json
+import shutil
+import tempfile
+import threading
+import time
+
+import kubernetes
+import kubernetes_asyncio
+import munch
+
+import k8v
+import k8v.backends.async_kubernetes_backend
+from k8v.resource_types import ResourceType
+
+
+class TestAsyncSearcher:
+    """Validate the AsyncSearcher produces the same results as the Searcher."""
+
+    def create_viewer(self, **kwargs) -> k8v.viewer.Viewer:
+        viewer = k8v.viewer.Viewer(
+            k8v.config.Config(
+                colors=None,
+                file=io.StringIO(""),
+                output="brief",
+                snapshot="tests/fixtures",
+                resources=[
+                    ResourceType.DEPLOYMENTS,
+                    ResourceType.DAEMON_SETS,
+                    ResourceType.PODS,
+                ],
+                **kwargs,
+            )
+        )
+        viewer.view()
+        return viewer
+
+    def test_create_searcher(self):
+        viewer = k8v.viewer.Viewer(k8v.config.Config(asynchronous=True))
+        assert isinstance(viewer.searcher, k8v.async_searcher.AsyncSearcher)
+
+    def test_search(self):
+        expected = self.create_viewer().config.file.getvalue()
+        viewer = self.create_viewer(asynchronous=True, parallel=4)
+        assert isinstance(viewer.searcher, k8v.async_searcher.AsyncSearcher)
+        assert viewer.config.file.getvalue() == expected
+
+    def test_related_search(self):
+        """Validate the related resources are searched for (once) alongside the types requested."""
+        expected = self.create_viewer(related=True).config.file.getvalue()
+        viewer = self.create_viewer(related=True, asynchronous=True, parallel=4)
+        assert viewer.config.file.getvalue() == expected
+        assert viewer.searcher._pending == {}
+        assert set(viewer.searcher._related) == {
+            ResourceType.REPLICA_SETS,
+            ResourceType.PODS,
+        }
+
+
+class FakeResponse:
+    """Fake aiohttp response for a list call (see: _preload_content)."""
+
+    def __init__(self, body: bytes, status: int = 200, encoding: str = None):
+        self.body = body
+        self.status = status
+        self.reason = "OK" if status == 200 else "Internal Server Error"
+        self.headers = {} if encoding is None else {"Content-Encoding": encoding}
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+class TestAsyncSearcherConcurrency:
+    """Validate the list calls are awaited from a single thread with at most *max_inflight* in flight."""
+
+    def setup(self):
+        self.active = 0
+        self.calls = []
+        self.threads = set()
+        self.status = 200
+        self.encoding = None
+        self.directory = tempfile.mkdtemp()
+        self.viewer = k8v.viewer.Viewer(
+            k8v.config.Config(
+                asynchronous=True,
+                cache_dir=self.directory,
+                namespaces=["ns1", "ns2", "ns3"],
+                max_inflight=3,
+            )
+        )
+        self.searcher = self.viewer.searcher
+        self.searcher.backend.api_client = kubernetes.client.ApiClient()
+        self.searcher.backend.handlers = k8v.registry.HandlerRegistry(
+            {
+                "FakeApi": {
+                    "configmap": {"type": "V1ConfigMap", "all": "list", "ns": "list"},
+                    "secret": {"type": "V1Secret", "all": "list", "ns": "list"},
+                }
+            }
+        ).bind(lambda group: munch.Munch(list=self.list_ns))
+
+    def teardown(self):
+        self.searcher.close()
+        shutil.rmtree(self.directory)
+
+    async def list_ns(self, namespace=None, **kwargs):
+        """Fake API handler returning two resources per namespace (in reverse name order)."""
+        assert kwargs.pop("_preload_content") is False
+        self.calls.append(kwargs)
+        self.threads.add(threading.get_ident())
+        self.active += 1
+        self.calls[-1]["active"] = self.active
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+        items = [{"metadata": {"name": f"{namespace}-{n}"}} for n in range(2, 0, -1)]
+        start = int(kwargs.get("_continue", 0))
+        end = start + (kwargs.get("limit") or len(items))
+        body = json.dumps(
+            {
+                "apiVersion": "v1",
+                "kind": "FakeList",
+                "metadata": {
+                    "continue": str(end) if end < len(items) else None,
+                    "resourceVersion": "1",
+                },
+                "items": items[start:end],
+            }
+        ).encode("utf-8")
+        if self.encoding == "gzip":
+            body = gzip.compress(body)
+        return FakeResponse(body, self.status, self.encoding)
+
+    def search_names(self) -> list:
+        return [
+            [r.metadata.name for r in resources]
+            for resources in self.searcher.search_all(
+                [ResourceType.CONFIG_MAP, ResourceType.SECRETS]
+            )
+        ]
+
+    def test_parallel(self):
+        names = self.search_names()
+        assert names[0] == names[1]
+        assert names[0] == [f"ns{ns}-{n}" for ns in range(1, 4) for n in range(1, 3)]
+        assert len(self.calls) == 6
+        assert max(call["active"] for call in self.calls) == 3
+        assert self.threads == {threading.get_ident()}
+
+    def test_default_max_inflight(self):
+        """Validate every list call is in flight at once by default (regardless of parallel)."""
+        self.viewer.config.max_inflight = k8v.config.Config().max_inflight
+        self.searcher.setup_executor()
+        self.search_names()
+        assert self.viewer.config.parallel == 1
+        assert max(call["active"] for call in self.calls) == 6
+
+    def test_close(self):
+        """Validate the searches still in flight are cancelled when the results are abandoned."""
+        self.viewer.config.max_inflight = 1
+        self.searcher.setup_executor()
+        results = self.searcher.search_all(
+            [ResourceType.CONFIG_MAP, ResourceType.SECRETS]
+        )
+        assert len(next(results)) == 6
+
+        tasks = asyncio.all_tasks(self.searcher.loop)
+        assert tasks and not any(task.done() for task in tasks)
+        self.searcher.close()
+        assert all(task.cancelled() for task in tasks)
+        assert len(self.calls) < 6
+
+    def test_paged(self):
+        expected = self.search_names()
+        self.viewer.config.page_size = 1
+        self.calls.clear()
+        assert self.search_names() == expected
+        assert len(self.calls) == 12
+
+    def test_verbose(self, capsys):
+        """Validate each list call is logged once (not once per page)."""
+        self.viewer.config.verbose = True
+        self.viewer.config.page_size = 1
+        self.search_names()
+        lines = capsys.readouterr().out.splitlines()
+        assert (
+            sorted(lines)
+            == ["Searching for configmap"] * 3 + ["Searching for secret"] * 3
+        )
+
+    def test_gzip_metrics(self, tmp_path):
+        """Validate compressed responses are decompressed and both sizes are recorded."""
+        expected = self.search_names()
+        self.encoding = "gzip"
+        self.viewer.config.metrics_file = str(tmp_path / "metrics.json")
+        assert self.search_names() == expected
+
+        summary = self.viewer.config.metrics.summary()
+        assert summary["requests"] == 6
+        assert summary["items"] == 12
+        assert 0 < summary["wire_bytes"] < summary["bytes"]
+
+    def test_profile(self):
+        """Validate the elapsed time of each request is recorded (without the CPU time of other tasks)."""
+        self.viewer.config.profile = True
+        self.search_names()
+        api = [r for r in self.viewer.config.profiler.results() if r["phase"] == "api"]
+        assert [r["calls"] for r in api] == [3, 3]
+        assert all(r["wall"] >= 0.03 and r["cpu"] == 0 and r["bytes"] for r in api)
+
+    def test_error(self, tmp_path):
+        self.status = 500
+        self.viewer.config.metrics_file = str(tmp_path / "metrics.json")
+        with pytest.raises(kubernetes_asyncio.client.exceptions.ApiException):
+            self.search_names()
+        assert self.viewer.config.metrics.summary()["errors"] > 0
+
+    def test_cache(self, tmp_path):
+        """Validate expired cache entries are validated (and recorded) using a single resource."""
+        self.searcher.cache = k8v.cache.ListCache(
+            self.viewer.config, "test", self.searcher.backend
+        )
+        self.viewer.config.cache_ttl = 60
+        expected = self.search_names()
+        assert self.search_names() == expected
+        assert len(self.calls) == 6
+
+        self.viewer.config.cache_ttl = 0.001
+        time.sleep(0.01)
+        self.viewer.config.metrics_file = str(tmp_path / "metrics.json")
+        assert self.search_names() == expected
+        assert [call["limit"] for call in self.calls[6:]] == [1] * 6
+        assert self.viewer.config.metrics.summary()["requests"] == 6
+
+
+class TestAsyncKubernetesBackend:
+    """Validate the connections to the Kubernetes API are configured as requested."""
+
+    def create_client(self, configuration=None, **kwargs) -> dict:
+        """Create a client and report its settings (it must be created by a running loop)."""
+
+        async def create():
+            backend = k8v.backends.async_kubernetes_backend.AsyncKubernetesBackend(
+                k8v.config.Config(**kwargs)
+            )
+            client = backend.create_async_client(
+                configuration or kubernetes_asyncio.client.Configuration()
+            )
+            session = client.rest_client.pool_manager
+            settings = {
+                "limit": session.connector.limit,
+                "connection": client.default_headers.get("Connection"),
+                "encoding": client.default_headers["Accept-Encoding"],
+                "auto_decompress": session.auto_decompress,
+            }
+            await client.close()
+            return settings
+
+        return asyncio.run(create())
+
+    def test_defaults(self):
+        assert self.create_client() == {
+            "limit": 64,
+            "connection": None,
+            "encoding": "identity",
+            "auto_decompress": False,
+        }
+
+    def test_options(self):
+        assert self.create_client(max_inflight=200, gzip=True, keep_alive=False) == {
+            "limit": 200,
+            "connection": "close",
+            "encoding": "gzip",
+            "auto_decompress": False,
+        }
+        assert self.create_client(max_inflight=200, pool_size=50)["limit"] == 50
+
+    def test_proxy(self):
+        """Validate the requests are sent through the proxy of the configuration."""
+        configuration = kubernetes_asyncio.client.Configuration()
+        configuration.proxy = "http://proxy:3128"
+        configuration.proxy_headers = {"Proxy-Authorization": "Basic dGVzdA=="}
+        requests = []
+
+        async def request(**kwargs):
+            requests.append(kwargs)
+            return FakeResponse(
+                json.dumps(
+                    {
+                        "apiVersion": "v1",
+                        "kind": "ConfigMapList",
+                        "metadata": {"resourceVersion": "1"},
+                        "items": [],
+                    }
+                ).encode("utf-8")
+            )
+
+        async def search():
+            backend = k8v.backends.async_kubernetes_backend.AsyncKubernetesBackend(
+                k8v.config.Config()
+            )
+            backend.async_client = backend.create_async_client(configuration)
+            backend.async_client.rest_client.pool_manager.request = request
+            backend.api_client = kubernetes.client.ApiClient()
+            backend.handlers = k8v.registry.get_registry().bind(
+                lambda group: getattr(kubernetes_asyncio.client, group)(
+                    backend.async_client
+                )
+            )
+            try:
+                return await backend.fetch_all(
+                    ResourceType.CONFIG_MAP,
+                    backend.handlers[ResourceType.CONFIG_MAP].all,
+                )
+            finally:
+                await backend.close()
+
+        assert asyncio.run(search()) == ([], "1")
+        assert requests[0]["proxy"] == "http://proxy:3128"
+        assert requests[0]["proxy_headers"] == configuration.proxy_headers
+        assert requests[0]["headers"]["Accept-Encoding"] == "identity"
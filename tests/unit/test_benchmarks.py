@@ -0,0 +1,60 @@
+import pytest
+import io
+
+import k8v
+from k8v.resource_types import ResourceType
+
+from benchmarks.benchmark import Benchmark, STAGES, FORMATTERS
+from benchmarks.cluster import ClusterGenerator
+
+
+class TestBenchmarks:
+    """Validate the synthetic clusters used for benchmarks are realistic enough to search."""
+
+    def setup(self):
+        self.generator = ClusterGenerator(deployments=8, replicas=2, namespaces=3)
+        self.resources = self.generator.generate()
+
+    def test_generate(self):
+        """Validate each deployment has a configmap, a replicaset and its pods."""
+        assert {type: len(r) for type, r in self.resources.items()} == {
+            ResourceType.CONFIG_MAP: 8,
+            ResourceType.DEPLOYMENTS: 8,
+            ResourceType.REPLICA_SETS: 8,
+            ResourceType.PODS: 16,
+        }
+        replicasets = {
+            r.metadata.uid for r in self.resources[ResourceType.REPLICA_SETS]
+        }
+        for pod in self.resources[ResourceType.PODS]:
+            assert pod.metadata.owner_references[0].uid in replicasets
+
+    def test_related(self):
+        """Validate related resources are found for the generated deployments."""
+        benchmark = Benchmark(self.generator)
+        benchmark.resources = self.resources
+        viewer = benchmark.create_viewer(
+            colors=None,
+            file=io.StringIO(""),
+            filename=None,
+            output="brief",
+            related=True,
+            resources=[ResourceType.DEPLOYMENTS],
+        )
+        viewer.printer.print_all(viewer.stream())
+        lines = viewer.config.file.getvalue().splitlines()
+        assert len(lines) == 8 * 4
+        assert lines[0] == "deployment/team-0/api-0"
+        assert lines[1].startswith("        replicaset/team-0/api-0-")
+        assert lines[2].startswith("                pod/team-0/api-0-")
+
+    def test_run(self):
+        """Validate every stage and formatter can be benchmarked."""
+        results = Benchmark(self.generator, memory=False).run(STAGES, FORMATTERS)
+        assert [r["stage"] for r in results] == [
+            "generate",
+            "filter",
+            "search",
+            "compact",
+        ] + [f"format:{output}" for output in FORMATTERS]
+        assert all(r["objects"] > 0 for r in results)
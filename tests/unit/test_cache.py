@@ -0,0 +1,128 @@
+import pytest
+import munch
+import os
+import shutil
+import tempfile
+import time
+import types
+
+import k8v
+
+
+class TestListCache:
+    """Validate list results are cached on disk and validated using their resourceVersion."""
+
+    def setup(self):
+        self.calls = []
+        self.resource_version = "1"
+        self.directory = tempfile.mkdtemp()
+        self.viewer: Viewer = k8v.viewer.Viewer(
+            k8v.config.Config(cache_ttl=60, cache_dir=self.directory)
+        )
+        self.searcher: k8v.searcher.Searcher = self.viewer.searcher
+        self.searcher.cache = k8v.cache.ListCache(
+            self.viewer.config, "test", self.searcher.backend
+        )
+
+    def teardown(self):
+        shutil.rmtree(self.directory)
+
+    def list_configmaps(self, namespace, **kwargs):
+        """Fake API handler returning a configmap with the current resourceVersion."""
+        self.calls.append(kwargs.get("limit"))
+        return types.SimpleNamespace(
+            api_version="v1",
+            kind="ConfigMapList",
+            items=[
+                munch.munchify({"metadata": {"name": f"cm-{self.resource_version}"}})
+            ],
+            metadata=types.SimpleNamespace(
+                _continue=None, resource_version=self.resource_version
+            ),
+        )
+
+    def list_names(self, **kwargs):
+        return [
+            r.metadata.name
+            for r in self.searcher.list_resources(
+                k8v.resource_types.ResourceType.CONFIG_MAP,
+                self.list_configmaps,
+                "default",
+                **kwargs,
+            )
+        ]
+
+    def expire(self):
+        """Force the cache entries to expire."""
+        self.viewer.config.cache_ttl = 0.001
+        time.sleep(0.01)
+
+    def test_cached(self):
+        """Validate results are served from the cache within the TTL."""
+        assert self.list_names() == ["cm-1"]
+        self.resource_version = "2"
+        assert self.list_names() == ["cm-1"]
+        assert self.calls == [500]
+
+    def test_entry_files(self):
+        """Validate each entry is stored with its metadata and no temporary files are left behind."""
+        assert self.list_names() == ["cm-1"]
+        files = sorted(os.listdir(self.directory))
+        key = files[0]
+        assert files == [key, key + ".json"]
+        assert self.searcher.cache.load_meta(key)["resource_version"] == "1"
+
+        # an entry is not stored (nor replaced) unless its resources are all listed
+        self.viewer.config.refresh = True
+        results = self.searcher.list_resources(
+            k8v.resource_types.ResourceType.CONFIG_MAP,
+            self.list_configmaps,
+            "other",
+        )
+        next(results)
+        results.close()
+        assert sorted(os.listdir(self.directory)) == files
+
+    def test_cache_key(self):
+        """Validate different selectors are cached separately."""
+        assert self.list_names() == ["cm-1"]
+        assert self.list_names(label_selector="app=nginx") == ["cm-1"]
+        assert self.calls == [500, 500]
+
+    def test_expired_unchanged(self):
+        """Validate expired results are reused if the resourceVersion has not changed."""
+        assert self.list_names() == ["cm-1"]
+        self.expire()
+        assert self.list_names() == ["cm-1"]
+        assert self.calls == [500, 1]
+
+    def test_expired_changed(self):
+        """Validate expired results are listed again if the resourceVersion has changed."""
+        assert self.list_names() == ["cm-1"]
+        self.expire()
+        self.resource_version = "2"
+        assert self.list_names() == ["cm-2"]
+        assert self.calls == [500, 1, 500]
+
+    def test_refresh(self):
+        """Validate the cache is bypassed (and updated) when refreshing."""
+        assert self.list_names() == ["cm-1"]
+        self.resource_version = "2"
+        self.viewer.config.refresh = True
+        assert self.list_names() == ["cm-2"]
+        self.viewer.config.refresh = False
+        assert self.list_names() == ["cm-2"]
+        assert self.calls == [500, 500]
+
+    def test_expired_metrics(self, tmp_path):
+        """Validate the request validating an expired entry is recorded in the metrics."""
+        assert self.list_names() == ["cm-1"]
+        self.expire()
+        self.viewer.config.metrics_file = str(tmp_path / "metrics.json")
+        assert self.list_names() == ["cm-1"]
+        assert self.calls == [500, 1]
+
+        summary = self.viewer.config.metrics.summary()
+        assert summary["requests"] == 1
+        assert summary["calls"][0]["type"] == "configmap"
+        assert summary["calls"][0]["namespace"] == "default"
@@ -0,0 +1,86 @@
+import pytest
+import io
+import pickle
+import tracemalloc
+
+import k8v
+
+from test_base import TestBase
+
+FIXTURES = [
+    "configmaps",
+    "cronjobs",
+    "daemonsets",
+    "deployments",
+    "jobs",
+    "persistentvolumeclaims",
+    "persistentvolumes",
+    "pods",
+    "replicasets",
+    "secrets",
+    "services",
+]
+
+
+class TestCompact(TestBase):
+    """Validate the compact records display the same as the kubernetes.client models."""
+
+    def setup(self):
+        self.config = k8v.config.Config(colors=None, file=io.StringIO(""))
+        self.config.load()
+        self.printer = k8v.printer.Printer(self.config)
+
+    def print_both(self, filename):
+        """Print the fixtures as models and as compact records and return both outputs."""
+        data = self.load_fixture(filename)
+        self.printer.print_all(data)
+        expected = self.config.file.getvalue()
+
+        self.config.file = io.StringIO("")
+        self.printer.print_all([k8v.compact.compact(r) for r in data])
+        return expected, self.config.file.getvalue()
+
+    def test_compact_config(self):
+        """Validate only the brief and default formatters use compact records."""
+        assert self.config.compact
+        for output, compact in [("brief", True), ("json", False), ("pickle", False)]:
+            self.config.output = output
+            self.config.load()
+            assert self.config.compact == compact
+
+    @pytest.mark.parametrize("fixture", FIXTURES)
+    def test_default_output(self, fixture):
+        self.config.related = True
+        expected, actual = self.print_both(f"tests/fixtures/{fixture}.pickle")
+        assert actual == expected
+
+    @pytest.mark.parametrize("fixture", FIXTURES)
+    def test_brief_output(self, fixture):
+        self.config.output = "brief"
+        self.config.load()
+        expected, actual = self.print_both(f"tests/fixtures/{fixture}.pickle")
+        assert actual == expected
+
+    def test_missing_attributes(self):
+        """Validate attributes missing from the model are also missing from the record."""
+        pod = k8v.compact.compact(self.load_fixture("tests/fixtures/pods.pickle")[0])
+        deploy = k8v.compact.compact(
+            self.load_fixture("tests/fixtures/deployments.pickle")[0]
+        )
+        assert hasattr(pod.spec, "service_account")
+        assert not hasattr(deploy.spec, "service_account")
+        assert not hasattr(pod, "__dict__")
+
+    def test_memory(self):
+        """Validate the compact records use an order of magnitude less memory."""
+        pod = pickle.dumps(self.load_fixture("tests/fixtures/pods.pickle")[1])
+
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        models = [pickle.loads(pod) for n in range(100)]
+        used = tracemalloc.get_traced_memory()[0]
+        records = [k8v.compact.compact(r) for r in models]
+        compacted = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        assert (compacted - used) * 10 < used - start
@@ -0,0 +1,41 @@
+import pytest
+import io
+
+from ansi.color import fg
+import ansi.color.fx as fx
+
+import k8v
+
+
+class TestConfig:
+    """Validate the configuration is loaded properly."""
+
+    def test_color_templates(self):
+        """Validate the color scheme is compiled into the ANSI codes wrapping text."""
+        config = k8v.config.Config(file=io.StringIO(""))
+        config.load()
+        assert config.color_templates["name"] == (
+            str(fg.cyan) + str(fx.bold),
+            str(fx.reset),
+        )
+        assert config.formatter.get_text("name", "nginx") == (
+            f"{fg.cyan}{fx.bold}nginx{fx.reset}"
+        )
+
+    def test_color_templates_none(self):
+        """Validate values that are not set (ex: the host of an ingress rule) can be colored."""
+        config = k8v.config.Config(file=io.StringIO(""))
+        config.load()
+        assert config.formatter.get_text("name", None) == (
+            f"{fg.cyan}{fx.bold}None{fx.reset}"
+        )
+        assert config.formatter.format(None, "/") == config.formatter.format(
+            "None", "/"
+        )
+
+    def test_no_colors(self):
+        """Validate text is not colored without a color scheme."""
+        config = k8v.config.Config(colors=None, file=io.StringIO(""))
+        config.load()
+        assert config.color_templates is None
+        assert config.formatter.get_text("name", "nginx") == "nginx"
@@ -1,6 +1,7 @@
 import pytest
 import io
 import json
+import kubernetes
 import munch
 
 import k8v
@@ -49,6 +50,68 @@ class TestJsonFormatter(TestBase):
         self.config.related = True
         self.test_cronjobs()  # should be the same
 
+    def test_api_compatible(self):
+        """Validate resources are written the same way as the Kubernetes API (and kubectl) would."""
+        data = self.load_fixture("tests/fixtures/deployments.pickle")[:1]
+        self.printer.print_all(data)
+        obj = json.loads(self.config.file.getvalue())[0]
+
+        # apiVersion and kind first, followed by the camelCase attributes without any nulls
+        assert list(obj.keys()) == ["apiVersion", "kind", "metadata", "spec", "status"]
+        assert obj["metadata"]["creationTimestamp"] == "2022-01-31T07:50:04Z"
+        assert obj["spec"]["strategy"]["rollingUpdate"]["maxSurge"] == "25%"
+        assert "type" not in obj and "_related" not in obj
+
+        # everything else is the same as the kubernetes.client serialization
+        expected = kubernetes.client.ApiClient().sanitize_for_serialization(data[0])
+        expected = json.loads(json.dumps(expected).replace('+00:00"', 'Z"'))
+        expected["apiVersion"] = "apps/v1"
+        assert obj == expected
+
+    def test_secrets(self):
+        """The type of a Secret is its own (ex: Opaque) and not the ResourceType of the search."""
+        body = {
+            "apiVersion": "v1",
+            "kind": "SecretList",
+            "metadata": {"resourceVersion": "1"},
+            "items": [
+                {
+                    "metadata": {"name": "nginx-sec", "namespace": "default"},
+                    "data": {"password": "c2VjcmV0"},
+                    "type": "Opaque",
+                }
+            ],
+        }
+        backend = k8v.backends.kubernetes_backend.KubernetesBackend(self.config)
+        backend.api_client = kubernetes.client.ApiClient()
+        backend.handlers = k8v.registry.get_registry().bind(
+            lambda group: getattr(kubernetes.client, group)(backend.api_client)
+        )
+        data, _, _ = backend.parse_response(
+            k8v.resource_types.ResourceType.SECRETS, "default", json.dumps(body)
+        )
+        assert data[0].type == k8v.resource_types.ResourceType.SECRETS
+        self.printer.print_all(data)
+        obj = json.loads(self.config.file.getvalue())[0]
+
+        assert obj["apiVersion"] == "v1" and obj["kind"] == "Secret"
+        assert obj["type"] == "Opaque"
+        assert obj["data"] == {"password": "c2VjcmV0"}
+
+    def test_secrets_fixture(self):
+        data = self.load_fixture("tests/fixtures/secrets.pickle")
+        self.printer.print_all(data)
+        resources = json.loads(self.config.file.getvalue())
+
+        # the type of the fixtures was replaced when recorded so it is left out
+        assert len(resources) == len(data)
+        assert resources[0]["metadata"]["name"] == "default-token-5r2mb"
+        assert all("type" not in r for r in resources)
+
+    def test_unknown_object(self):
+        with pytest.raises(TypeError):
+            k8v.serializer.serialize(object())
+
 
 #     def test_daemonsets(self):
 #         data = self.load_and_display("tests/fixtures/daemonsets.pickle")
@@ -0,0 +1,48 @@
+import pytest
+import socket
+
+import k8v
+
+
+class TestKubernetesBackend:
+    """Validate the connections to the Kubernetes API are configured as requested."""
+
+    def setup(self):
+        self.config = k8v.config.Config()
+        self.backend = k8v.backends.kubernetes_backend.KubernetesBackend(self.config)
+
+    def test_defaults(self):
+        api_client = self.backend.create_api_client()
+        assert api_client.configuration.connection_pool_maxsize == 4
+        assert (
+            socket.SOL_SOCKET,
+            socket.SO_KEEPALIVE,
+            1,
+        ) in api_client.rest_client.pool_manager.connection_pool_kw["socket_options"]
+        assert "Accept-Encoding" not in api_client.default_headers
+        assert "Connection" not in api_client.default_headers
+
+    def test_pool_size(self):
+        """Validate the pool holds a connection for each concurrent list call (unless specified)."""
+        self.config.parallel = 16
+        assert (
+            self.backend.create_api_client().configuration.connection_pool_maxsize == 16
+        )
+        self.config.pool_size = 32
+        assert (
+            self.backend.create_api_client().configuration.connection_pool_maxsize == 32
+        )
+
+    def test_gzip(self):
+        self.config.gzip = True
+        api_client = self.backend.create_api_client()
+        assert api_client.default_headers["Accept-Encoding"] == "gzip"
+
+    def test_no_keep_alive(self):
+        self.config.keep_alive = False
+        api_client = self.backend.create_api_client()
+        assert api_client.default_headers["Connection"] == "close"
+        assert (
+            "socket_options"
+            not in api_client.rest_client.pool_manager.connection_pool_kw
+        )
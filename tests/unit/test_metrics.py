@@ -0,0 +1,81 @@
+import pytest
+import json
+
+import k8v
+from k8v.resource_types import ResourceType
+
+
+class TestMetrics:
+    """Validate the requests sent to the Kubernetes API are summarized and exported."""
+
+    def setup(self):
+        self.config = k8v.config.Config()
+        self.metrics = self.config.metrics
+        self.metrics.record(ResourceType.PODS, "default", 0.02, 1000, 10, 250)
+        self.metrics.record(ResourceType.PODS, "default", 0.3, 500, 5)
+        self.metrics.record(ResourceType.PODS, None, 20, error=True)
+        self.metrics.record(ResourceType.CONFIG_MAP, "default", 0.001, 200, 2)
+        self.metrics.record_watch(ResourceType.CONFIG_MAP, "default")
+
+    def test_enabled(self):
+        assert not self.metrics.enabled
+        self.config.metrics_prom = "k8v.prom"
+        assert self.metrics.enabled
+
+    def test_summary(self):
+        summary = self.metrics.summary()
+        assert summary["requests"] == 4
+        assert summary["errors"] == 1
+        assert summary["bytes"] == 1700
+        assert summary["items"] == 17
+        assert summary["wire_bytes"] == 250
+        assert summary["watches"] == 1
+        assert summary["compression"] == 1700 / 250
+
+        calls = {(c["type"], c["namespace"]): c for c in summary["calls"]}
+        pods = calls[("pod", "default")]
+        assert pods["requests"] == 2
+        assert pods["errors"] == 0
+        assert pods["seconds"] == pytest.approx(0.32)
+        assert pods["latency"]["0.025"] == 1
+        assert pods["latency"]["0.5"] == 1
+        assert sum(pods["latency"].values()) == 2
+        assert calls[("pod", None)]["latency"]["+Inf"] == 1
+        assert calls[("configmap", "default")]["latency"]["0.005"] == 1
+
+    def test_prometheus(self):
+        lines = self.metrics.prometheus().splitlines()
+        assert "# TYPE k8v_api_requests_total counter" in lines
+        assert 'k8v_api_requests_total{type="pod",namespace="default"} 2' in lines
+        assert 'k8v_api_request_errors_total{type="pod",namespace=""} 1' in lines
+        assert (
+            'k8v_api_response_bytes_total{type="pod",namespace="default"} 1500' in lines
+        )
+        assert (
+            'k8v_api_response_wire_bytes_total{type="pod",namespace="default"} 250'
+            in lines
+        )
+        assert 'k8v_api_watches_total{type="configmap",namespace="default"} 1' in lines
+        assert "# TYPE k8v_api_request_duration_seconds histogram" in lines
+
+        # buckets are cumulative
+        prefix = (
+            'k8v_api_request_duration_seconds_bucket{type="pod",namespace="default",'
+        )
+        assert prefix + 'le="0.01"} 0' in lines
+        assert prefix + 'le="0.025"} 1' in lines
+        assert prefix + 'le="0.5"} 2' in lines
+        assert prefix + 'le="+Inf"} 2' in lines
+        assert (
+            'k8v_api_request_duration_seconds_count{type="pod",namespace="default"} 2'
+            in lines
+        )
+
+    def test_export(self, tmp_path):
+        self.config.metrics_file = str(tmp_path / "metrics.json")
+        self.config.metrics_prom = str(tmp_path / "k8v.prom")
+        self.metrics.export()
+        with open(self.config.metrics_file) as f:
+            assert json.load(f)["requests"] == 4
+        with open(self.config.metrics_prom) as f:
+            assert f.read() == self.metrics.prometheus()
@@ -0,0 +1,65 @@
+import pytest
+import io
+import json
+
+import k8v
+
+from test_base import TestBase
+
+
+class FlushCountingIO(io.StringIO):
+    """StringIO that records how many lines had been written each time it was flushed."""
+
+    def __init__(self):
+        super().__init__("")
+        self.flushes = []
+
+    def flush(self):
+        self.flushes.append(self.getvalue().count("\n"))
+
+
+class TestNdjsonFormatter(TestBase):
+    """Validate the NdjsonFormatter writes one JSON resource per line."""
+
+    def setup(self):
+        self.config = k8v.config.Config(
+            colors=None, file=FlushCountingIO(), output="ndjson"
+        )
+        self.config.load()
+        self.printer = k8v.printer.Printer(self.config)
+
+    def test_pods(self):
+        data = self.load_fixture("tests/fixtures/pods.pickle")
+        assert self.printer.print_all(iter(data)) == len(data)
+
+        lines = self.config.file.getvalue().splitlines()
+        assert len(lines) == len(data)
+        assert [json.loads(line)["metadata"]["name"] for line in lines] == [
+            r.metadata.name for r in data
+        ]
+
+    def test_related(self):
+        """Validate related resources are written on their own (unindented) lines."""
+        self.config.related = True
+        data = self.load_fixture("tests/fixtures/deployments.pickle")[:1]
+        self.printer.print_all(data)
+
+        lines = self.config.file.getvalue().splitlines()
+        assert [json.loads(line)["kind"] for line in lines] == [
+            "Deployment",
+            "ReplicaSet",
+            "Pod",
+            "Pod",
+        ]
+        assert all(line.startswith("{") for line in lines)
+
+    def test_empty(self):
+        assert self.printer.print_all(iter([])) == 0
+        assert self.config.file.getvalue() == ""
+
+    def test_flush_per_page(self):
+        """Validate the output is flushed after every page of resources."""
+        self.config.page_size = 2
+        data = self.load_fixture("tests/fixtures/pods.pickle")
+        self.printer.print_all(data + data)
+        assert self.config.file.flushes == [2, 4, 6, 6]
@@ -0,0 +1,61 @@
+import pytest
+
+import k8v
+
+
+class TestQueryPlanner:
+    """Validate which search criteria are pushed down to the API server."""
+
+    def setup(self):
+        self.config = k8v.config.Config()
+        self.planner = k8v.planner.QueryPlanner(self.config)
+
+    def test_no_criteria(self):
+        """Validate nothing is sent to the API server without any criteria."""
+        assert self.planner.plan(k8v.resource_types.ResourceType.PODS) == {}
+
+    def test_substring_criteria(self):
+        """Validate substring includes/excludes are left to client-side filtering."""
+        self.config.includes.append("nginx")
+        self.config.excludes.append("nginx-sec")
+        assert self.planner.plan(k8v.resource_types.ResourceType.PODS) == {}
+
+    def test_label_selectors(self):
+        """Validate label selectors are combined into a single expression."""
+        self.config.selectors = {"app": "nginx", "tier": "web"}
+        assert self.planner.plan(k8v.resource_types.ResourceType.SECRETS) == {
+            "label_selector": "app=nginx,tier=web"
+        }
+
+    def test_exact_name(self):
+        """Validate a single exact name is sent as a field selector."""
+        self.config.names.append("nginx")
+        assert self.planner.plan(k8v.resource_types.ResourceType.SERVICES) == {
+            "field_selector": "metadata.name=nginx"
+        }
+
+    def test_multiple_exact_names(self):
+        """Validate multiple exact names fall back to client-side filtering."""
+        self.config.names.extend(["nginx", "nginx-cm"])
+        assert self.planner.plan(k8v.resource_types.ResourceType.SERVICES) == {}
+
+    def test_excluded_namespaces(self):
+        """Validate excluded namespaces are only sent when searching all namespaces."""
+        self.config.excluded_namespaces.extend(["kube-system", "kube-public"])
+        assert self.planner.plan(k8v.resource_types.ResourceType.PODS) == {}
+
+        self.config.namespaces = None
+        assert self.planner.plan(k8v.resource_types.ResourceType.PODS) == {
+            "field_selector": "metadata.namespace!=kube-system,metadata.namespace!=kube-public"
+        }
+
+    def test_phase(self):
+        """Validate the phase is only sent for resource types that support it."""
+        self.config.phase = "Running"
+        self.config.names.append("nginx")
+        assert self.planner.plan(k8v.resource_types.ResourceType.PODS) == {
+            "field_selector": "metadata.name=nginx,status.phase=Running"
+        }
+        assert self.planner.plan(
+            k8v.resource_types.ResourceType.PERSISTENT_VOLUME_CLAIM
+        ) == {"field_selector": "metadata.name=nginx"}
@@ -27,3 +27,28 @@ class TestPrinter(TestBase):
 
     def test_json(self):
         pass
+
+    def test_stream_json(self):
+        """Validate resources streamed from an iterator with related resources produce valid JSON."""
+        self.config.output = "json"
+        self.config.related = True
+        self.config.load()
+
+        data = self.load_fixture("tests/fixtures/deployments.pickle")
+        assert self.printer.print_all(iter(data)) == len(data)
+
+        # the deployment is followed by its replicaset and pods
+        obj = munch.munchify(json.loads(self.config.file.getvalue()))
+        assert [o.metadata.name for o in obj[:4]] == [
+            "nginx-deployment",
+            "nginx-deployment-7b6fcd488c",
+            "nginx-deployment-7b6fcd488c-sr2wv",
+            "nginx-deployment-7b6fcd488c-vrgrx",
+        ]
+
+    def test_stream_json_empty(self):
+        """Validate an empty iterator still produces a valid JSON list."""
+        self.config.output = "json"
+        self.config.load()
+        assert self.printer.print_all(iter([])) == 0
+        assert json.loads(self.config.file.getvalue()) == []
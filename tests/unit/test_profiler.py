@@ -0,0 +1,106 @@
+import pytest
+import io
+import json
+import time
+
+import k8v
+
+
+class TestProfiler:
+    """Validate the time spent in each phase of a search is reported when profiling."""
+
+    def setup(self):
+        self.config = k8v.config.Config(
+            colors=None,
+            file=io.StringIO(""),
+            output="brief",
+            related=True,
+            snapshot="tests/fixtures",
+            resources=[
+                k8v.resource_types.ResourceType.DEPLOYMENTS,
+                k8v.resource_types.ResourceType.PODS,
+            ],
+        )
+        self.viewer = k8v.viewer.Viewer(self.config)
+
+    def test_disabled(self, capsys):
+        """Validate nothing is measured (or reported) unless profiling is enabled."""
+        profiler = self.config.profiler
+        assert profiler.phase("api") is k8v.profiler.NULL_PHASE
+        assert profiler.wrap("filter", None, len) is len
+        profiler.record("api", None, 1.0)
+        self.viewer.view()
+        assert profiler.results() == []
+        assert capsys.readouterr().err == ""
+
+    def test_report(self, capsys):
+        """Validate each phase is reported per resource type on STDERR."""
+        self.config.profile = True
+        self.viewer.view()
+        lines = capsys.readouterr().err.splitlines()
+        assert lines[0].split() == [
+            "phase",
+            "type",
+            "calls",
+            "wall",
+            "(s)",
+            "cpu",
+            "(s)",
+            "bytes",
+        ]
+        calls = {tuple(line.split()[:2]): int(line.split()[2]) for line in lines[1:]}
+        assert calls[("load", "-")] == 1
+        assert calls[("setup", "-")] == 1
+        assert calls[("filter", "deployment")] == 1
+        assert calls[("filter", "pod")] == 1
+        assert calls[("related", "deployment")] == 1
+        assert calls[("compact", "pod")] > 0
+        assert calls[("format", "deployment")] == 1
+        assert calls[("format", "replicaset")] == 1
+        assert calls[("format", "pod")] == 5
+
+    def test_nested(self):
+        """Validate the time of nested phases is only reported for those (self time)."""
+        self.config.profile = True
+        profiler = self.config.profiler
+        with profiler.phase("related"):
+            time.sleep(0.01)
+            with profiler.phase("api"):
+                time.sleep(0.05)
+        results = {r["phase"]: r for r in profiler.results()}
+        assert results["api"]["wall"] >= 0.05
+        assert 0.01 <= results["related"]["wall"] < 0.05
+        assert profiler.get_stack() == []
+
+    def test_record(self):
+        """Validate phases timed by the caller (ex: awaited requests) are recorded without CPU time."""
+        self.config.profile = True
+        profiler = self.config.profiler
+        profiler.record("api", k8v.resource_types.ResourceType.PODS, 0.5, 100)
+        profiler.record("api", k8v.resource_types.ResourceType.PODS, 0.25)
+        assert profiler.results() == [
+            {
+                "phase": "api",
+                "type": "pod",
+                "calls": 2,
+                "wall": 0.75,
+                "cpu": 0.0,
+                "bytes": 100,
+            }
+        ]
+
+    def test_json(self, capsys):
+        self.config.profile = True
+        self.config.profile_format = "json"
+        self.viewer.view()
+        results = json.loads(capsys.readouterr().err)
+        assert {
+            "phase": "format",
+            "type": "pod",
+            "calls": 5,
+            "bytes": 0,
+        } in [
+            {key: r[key] for key in ["phase", "type", "calls", "bytes"]}
+            for r in results
+        ]
+        assert all(r["wall"] >= 0 and r["cpu"] >= 0 for r in results)
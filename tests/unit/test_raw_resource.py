@@ -0,0 +1,86 @@
+import pytest
+import copy
+import io
+import json
+
+import kubernetes
+
+import k8v
+
+from test_base import TestBase
+
+
+class TestRawResource(TestBase):
+    """Validate the formatters produce the same output from raw JSON as from the models."""
+
+    def setup(self):
+        self.config = k8v.config.Config(colors=None, file=io.StringIO(""))
+        self.config.load()
+        self.printer = k8v.printer.Printer(self.config)
+        self.api_client = kubernetes.client.ApiClient()
+
+    def to_raw(self, resource):
+        """Convert a model into a RawResource the same way it would be returned by the API."""
+        model = copy.copy(resource)
+        if "type" in model.openapi_types:
+            model.type = None  # replaced by the ResourceType (ex: V1Secret)
+        data = json.loads(json.dumps(self.api_client.sanitize_for_serialization(model)))
+        raw = k8v.raw_resource.RawResource(data, resource.__class__)
+        raw.type = resource.type
+        raw.apiVersion = resource.apiVersion
+        raw.kind = resource.kind
+        raw._related = []
+        return raw
+
+    def print_both(self, filename):
+        """Print the fixtures as models and as raw resources and return both outputs."""
+        data = self.load_fixture(filename)
+        self.printer.print_all(data)
+        expected = self.config.file.getvalue()
+
+        self.config.file = io.StringIO("")
+        self.printer.print_all([self.to_raw(r) for r in data])
+        return expected, self.config.file.getvalue()
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "configmaps",
+            "cronjobs",
+            "daemonsets",
+            "deployments",
+            "jobs",
+            "persistentvolumeclaims",
+            "persistentvolumes",
+            "pods",
+            "replicasets",
+            "secrets",
+            "services",
+        ],
+    )
+    def test_default_output(self, fixture):
+        expected, actual = self.print_both(f"tests/fixtures/{fixture}.pickle")
+        assert actual == expected
+
+    def test_brief_output(self):
+        self.config.output = "brief"
+        self.config.load()
+        expected, actual = self.print_both("tests/fixtures/pods.pickle")
+        assert actual == expected
+
+    def test_json_output(self):
+        """Validate raw resources are written as JSON using the API field names."""
+        self.config.output = "json"
+        self.config.load()
+        self.printer.print_all(
+            [self.to_raw(r) for r in self.load_fixture("tests/fixtures/pods.pickle")]
+        )
+        obj = json.loads(self.config.file.getvalue())
+        assert obj[0]["apiVersion"] == "v1"
+        assert obj[0]["kind"] == "Pod"
+        assert obj[1]["spec"]["serviceAccountName"] == "default"
+
+    def test_missing_attribute(self):
+        raw = k8v.raw_resource.RawResource({}, kubernetes.client.V1Pod)
+        assert raw.spec is None
+        assert not hasattr(raw, "not_an_attribute")
@@ -0,0 +1,79 @@
+import pytest
+import io
+import munch
+import os
+
+import k8v
+
+
+class TestRegistry:
+    """Validate the handler registry maps each ResourceType to the functions used to list it."""
+
+    def setup(self):
+        self.registry = k8v.registry.get_registry()
+        self.groups = []
+
+    def create_api(self, group):
+        """Fake API group where each function returns its own name."""
+        self.groups.append(group)
+        return munch.Munch(
+            {
+                name: name
+                for data in self.registry.handler_config[group].values()
+                for name in [data.get("all"), data.get("ns")]
+                if name is not None
+            }
+        )
+
+    def test_bind(self):
+        """Validate each API group is only created once and every type is mapped."""
+        handlers = self.registry.bind(self.create_api)
+        assert sorted(self.groups) == [
+            "AppsV1Api",
+            "BatchV1Api",
+            "CoreV1Api",
+            "NetworkingV1Api",
+            "RbacAuthorizationV1Api",
+        ]
+        assert set(handlers.keys()) == set(k8v.resource_types.ResourceType)
+        assert handlers[k8v.resource_types.ResourceType.PODS] == (
+            "list_pod_for_all_namespaces",
+            "list_namespaced_pod",
+            "V1Pod",
+        )
+
+        # cluster scoped resources can only be listed across all namespaces
+        assert handlers[k8v.resource_types.ResourceType.PERSISTENT_VOLUME].ns is None
+
+    def test_get_api_handler(self):
+        """Validate the backend returns the handler for the namespace(s) searched."""
+        viewer = k8v.viewer.Viewer(k8v.config.Config(namespaces=["default"]))
+        backend = viewer.searcher.backend
+        backend.handlers = self.registry.bind(self.create_api)
+        assert (
+            backend.get_api_handler(k8v.resource_types.ResourceType.DEPLOYMENTS)
+            == "list_namespaced_deployment"
+        )
+        assert (
+            backend.get_api_handler(k8v.resource_types.ResourceType.CLUSTER_ROLES)
+            is None
+        )
+        viewer.config.namespaces = None
+        assert (
+            backend.get_api_handler(k8v.resource_types.ResourceType.CLUSTER_ROLES)
+            == "list_cluster_role"
+        )
+        assert (
+            backend.get_model_type(k8v.resource_types.ResourceType.CLUSTER_ROLES)
+            == "V1ClusterRole"
+        )
+
+    def test_any_directory(self, tmp_path, monkeypatch):
+        """Validate the packaged data files are found from any directory."""
+        monkeypatch.chdir(tmp_path)
+        config = k8v.config.Config(file=io.StringIO(""))
+        config.load()
+        assert config.color_templates is not None
+        registry = k8v.registry.HandlerRegistry(k8v.registry.load_data("handlers.json"))
+        group, handler = registry.types[k8v.resource_types.ResourceType.SECRETS]
+        assert handler["type"] == "V1Secret"
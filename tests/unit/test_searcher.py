@@ -1,5 +1,8 @@
+import json
+import kubernetes
 import munch
 import pytest
+import types
 import yaml
 
 import k8v
@@ -28,6 +31,34 @@ class TestSearcher:
             r.metadata.name for r in self.searcher.filter_resources(self.resources)
         ]
 
+    def test_multiple_include_filters(self):
+        """Validate each include filter is applied (any of them can match)."""
+        self.viewer.config.includes.extend(["-cm", "-pvc", "deploy"])
+        assert ["nginx-cm", "nginx-pvc", "nginx-deployment"] == [
+            r.metadata.name for r in self.searcher.filter_resources(self.resources)
+        ]
+
+    def test_multiple_exclude_filters(self):
+        """Validate each exclude filter is applied."""
+        self.viewer.config.excludes.extend(["-sec", "-pvc", "deploy"])
+        assert ["nginx-cm", "nginx"] == [
+            r.metadata.name for r in self.searcher.filter_resources(self.resources)
+        ]
+
+    def test_special_characters_filter(self):
+        """Validate filters are matched as plain sub-strings rather than expressions."""
+        self.viewer.config.includes.extend(["nginx.", "x-c"])
+        assert ["nginx-cm"] == [
+            r.metadata.name for r in self.searcher.filter_resources(self.resources)
+        ]
+
+    def test_selector_filter(self):
+        """Validate resources without the matching labels are filtered out."""
+        self.viewer.config.selectors["app"] = "nginx"
+        assert ["nginx-deployment"] == [
+            r.metadata.name for r in self.searcher.filter_resources(self.resources)
+        ]
+
     def test_exclude_filter(self):
         """Validate sub-string resource exclusion filtering."""
         self.viewer.config.excludes.append("nginx-sec")
@@ -35,6 +66,21 @@ class TestSearcher:
             r.metadata.name for r in self.searcher.filter_resources(self.resources)
         ]
 
+    def test_name_filter(self):
+        """Validate exact name filtering."""
+        self.viewer.config.names.extend(["nginx", "nginx-cm"])
+        assert ["nginx-cm", "nginx"] == [
+            r.metadata.name for r in self.searcher.filter_resources(self.resources)
+        ]
+
+    def test_phase_filter(self):
+        """Validate resources without a matching phase are filtered out."""
+        self.resources[2].status = munch.Munch(phase="Bound")
+        self.viewer.config.phase = "Bound"
+        assert ["nginx-pvc"] == [
+            r.metadata.name for r in self.searcher.filter_resources(self.resources)
+        ]
+
     def test_include_and_exclude_filters(self):
         """Validate that combination of include and exclude filters work as expected."""
         self.viewer.config.includes.append("nginx-")
@@ -42,3 +88,277 @@ class TestSearcher:
         assert ["nginx-cm", "nginx-sec", "nginx-deployment"] == [
             r.metadata.name for r in self.searcher.filter_resources(self.resources)
         ]
+
+
+def list_response(
+    kind: str, items: list, limit: int = None, _continue: str = None, **kwargs
+):
+    """Build a fake list response for a page of items using limit/continue semantics."""
+    start = int(_continue or 0)
+    end = len(items) if limit is None else start + limit
+    return types.SimpleNamespace(
+        api_version="v1",
+        kind=kind,
+        items=items[start:end],
+        metadata=types.SimpleNamespace(
+            _continue=str(end) if end < len(items) else None, resource_version="1"
+        ),
+    )
+
+
+class TestSearcherConcurrency:
+    """Validate the Searcher issues list calls concurrently and merges results deterministically."""
+
+    def setup(self):
+        self.calls = []
+        self.kwargs = []
+        self.viewer: Viewer = k8v.viewer.Viewer(
+            k8v.config.Config(namespaces=["ns1", "ns2", "ns3"])
+        )
+        self.searcher: k8v.searcher.Searcher = self.viewer.searcher
+        self.searcher.backend.handlers = k8v.registry.HandlerRegistry(
+            {
+                "FakeApi": {
+                    "configmap": {
+                        "type": "V1ConfigMap",
+                        "all": "list_all",
+                        "ns": "list_ns",
+                    },
+                    "secret": {"type": "V1Secret", "all": "list_all", "ns": "list_ns"},
+                }
+            }
+        ).bind(lambda group: munch.Munch(list_all=self.list_ns, list_ns=self.list_ns))
+
+    def list_ns(self, namespace=None, **kwargs):
+        """Fake API handler returning resources in reverse name order for a namespace."""
+        self.calls.append(namespace)
+        self.kwargs.append(kwargs)
+        if kwargs.pop("_preload_content", True) is False:
+            response = self.list_ns(namespace, **kwargs)
+            self.calls.pop()
+            self.kwargs.pop()
+            data = json.dumps(
+                {
+                    "apiVersion": response.api_version,
+                    "kind": response.kind,
+                    "metadata": {"continue": response.metadata._continue},
+                    "items": [item.toDict() for item in response.items],
+                }
+            ).encode("utf-8")
+            # bytes received on the wire as if the response was compressed
+            return types.SimpleNamespace(data=data, tell=lambda: len(data) // 4)
+        return list_response(
+            "FakeList",
+            [
+                munch.munchify(
+                    {
+                        "metadata": {
+                            "name": f"{namespace}-{n}",
+                            "namespace": namespace,
+                            "labels": {"app": "nginx", "tier": "web"},
+                        }
+                    }
+                )
+                for n in range(3, 0, -1)
+            ],
+            **kwargs,
+        )
+
+    def search_names(self):
+        return [
+            [r.metadata.name for r in resources]
+            for resources in self.searcher.search_all(
+                [
+                    k8v.resource_types.ResourceType.CONFIG_MAP,
+                    k8v.resource_types.ResourceType.SECRETS,
+                ]
+            )
+        ]
+
+    def test_serial_search(self):
+        """Validate list calls are issued once per type and namespace."""
+        names = self.search_names()
+        assert len(self.calls) == 6
+        assert names[0] == names[1]
+        assert names[0] == [f"ns{ns}-{n}" for ns in range(1, 4) for n in range(1, 4)]
+
+    def test_parallel_search(self):
+        """Validate the concurrent search produces the same results as the serial search."""
+        expected = self.search_names()
+        self.viewer.config.parallel = 4
+        self.searcher.setup_executor()
+        assert self.search_names() == expected
+        assert len(self.calls) == 12
+
+    def test_paged_search(self):
+        """Validate each list call pages through the results using the continue token."""
+        expected = self.search_names()
+        self.viewer.config.page_size = 2
+        assert self.search_names() == expected
+        assert len(self.calls) == 6 + 12
+
+    def test_verbose_search(self, capsys):
+        """Validate each list call is logged once (not once per page)."""
+        self.viewer.config.verbose = True
+        self.viewer.config.page_size = 2
+        self.search_names()
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == ["Searching for configmap"] * 3 + ["Searching for secret"] * 3
+
+    def test_raw_search(self):
+        """Validate the raw JSON responses produce the same results as the models."""
+        expected = self.search_names()
+        self.viewer.config.raw = True
+        self.viewer.config.page_size = 2
+        for resources in self.searcher.search_all(
+            [k8v.resource_types.ResourceType.CONFIG_MAP]
+        ):
+            assert [r.metadata.name for r in resources] == expected[0]
+            assert [r.kind for r in resources] == ["Fake"] * 9
+            assert isinstance(resources[0], k8v.raw_resource.RawResource)
+
+    def test_profiled_search(self):
+        """Validate profiling measures the response size and deserialization of each list call."""
+        expected = self.search_names()
+        self.viewer.config.profile = True
+        self.searcher.backend.api_client = kubernetes.client.ApiClient()
+        assert self.search_names() == expected
+
+        results = {
+            (r["phase"], r["type"]): r for r in self.viewer.config.profiler.results()
+        }
+        assert results[("api", "configmap")]["calls"] == 3
+        assert results[("api", "configmap")]["bytes"] > 0
+        assert results[("deserialize", "secret")]["calls"] == 3
+        # filtering is timed once per page (not per resource)
+        assert results[("filter", "secret")]["calls"] == 3
+
+    def test_metered_search(self, tmp_path):
+        """Validate each list call is recorded when exporting metrics."""
+        expected = self.search_names()
+        self.viewer.config.metrics_file = str(tmp_path / "metrics.json")
+        self.searcher.backend.api_client = kubernetes.client.ApiClient()
+        assert self.search_names() == expected
+
+        summary = self.viewer.config.metrics.summary()
+        calls = {(c["type"], c["namespace"]): c for c in summary["calls"]}
+        assert summary["requests"] == 6
+        assert summary["errors"] == 0
+        assert summary["items"] == 18
+        assert calls[("configmap", "ns1")]["requests"] == 1
+        assert calls[("configmap", "ns1")]["bytes"] > 0
+        assert calls[("secret", "ns3")]["items"] == 3
+        assert summary["wire_bytes"] == sum(c["wire_bytes"] for c in calls.values())
+        assert summary["compression"] == pytest.approx(4, rel=0.1)
+
+    def test_label_selector_pushdown(self):
+        """Validate the label selectors are sent to the API server for top-level searches."""
+        expected = self.search_names()
+        self.kwargs.clear()
+        self.viewer.config.selectors = {"app": "nginx", "tier": "web"}
+        assert self.search_names() == expected
+        assert len(self.kwargs) == 6
+        for kwargs in self.kwargs:
+            assert kwargs["label_selector"] == "app=nginx,tier=web"
+
+        # related searches should not be restricted by the selectors
+        self.kwargs.clear()
+        self.searcher.search(k8v.resource_types.ResourceType.CONFIG_MAP)
+        assert "label_selector" not in self.kwargs[0]
+
+
+class TestSearcherRelated:
+    """Validate related resources are joined in memory from a fixed number of list calls."""
+
+    def setup(self):
+        self.calls = []
+        self.viewer: Viewer = k8v.viewer.Viewer(
+            k8v.config.Config(namespaces=["default"], related=True)
+        )
+        self.searcher: k8v.searcher.Searcher = self.viewer.searcher
+        self.searcher.backend.handlers = k8v.registry.HandlerRegistry(
+            {
+                "FakeApi": {
+                    "deployment": {"all": "list_deployment", "ns": "list_deployment"},
+                    "replicaset": {"all": "list_replicaset", "ns": "list_replicaset"},
+                    "pod": {"all": "list_pod", "ns": "list_pod"},
+                    "statefulset": {
+                        "all": "list_statefulset",
+                        "ns": "list_statefulset",
+                    },
+                }
+            }
+        ).bind(
+            lambda group: munch.Munch(
+                list_deployment=lambda ns, **kwargs: self.list("deployment", ns),
+                list_replicaset=lambda ns, **kwargs: self.list("replicaset", ns),
+                list_pod=lambda ns, **kwargs: self.list("pod", ns),
+                list_statefulset=lambda ns, **kwargs: self.list("statefulset", ns),
+            )
+        )
+
+        # create N deployments each with a replicaset and two pods
+        self.resources = {
+            "deployment": [],
+            "replicaset": [],
+            "pod": [],
+            "statefulset": [],
+        }
+        for n in range(10):
+            labels = {"app": f"app{n}"}
+            self.add("deployment", f"app{n}", labels, labels)
+            self.add("replicaset", f"app{n}-rs", labels, labels, owner=f"app{n}")
+            self.add("pod", f"app{n}-rs-a", labels, owner=f"app{n}-rs")
+            self.add("pod", f"app{n}-rs-b", labels, owner=f"app{n}-rs")
+
+        # statefulsets with overlapping names
+        self.add("statefulset", "db", {"app": "db"}, {"app": "db"})
+        self.add("statefulset", "db-backup", {"app": "db"}, {"app": "db"})
+        self.add("pod", "db-0", {"app": "db"}, owner="db")
+        self.add("pod", "db-backup-0", {"app": "db"}, owner="db-backup")
+
+    def add(self, kind, name, labels, selector=None, owner=None):
+        resource = {
+            "metadata": {
+                "name": name,
+                "namespace": "default",
+                "labels": labels,
+                "uid": f"uid-{name}",
+                "owner_references": None,
+            }
+        }
+        if selector is not None:
+            resource["spec"] = {"selector": {"match_labels": selector}}
+        if owner is not None:
+            resource["metadata"]["owner_references"] = [{"uid": f"uid-{owner}"}]
+        self.resources[kind].append(munch.munchify(resource))
+
+    def list(self, kind, namespace):
+        self.calls.append(kind)
+        return list_response(f"{kind}List", self.resources[kind])
+
+    def test_related_call_count(self):
+        """Validate related lookups cost one list call per child type regardless of parents."""
+        deployments = next(
+            self.searcher.search_all([k8v.resource_types.ResourceType.DEPLOYMENTS])
+        )
+        assert sorted(self.calls) == ["deployment", "pod", "replicaset"]
+        assert len(deployments) == 10
+
+        for n, deploy in enumerate(deployments):
+            assert [r.metadata.name for r in deploy._related] == [f"app{n}-rs"]
+            assert [p.metadata.name for p in deploy._related[0]._related] == [
+                f"app{n}-rs-a",
+                f"app{n}-rs-b",
+            ]
+
+    def test_statefulset_related(self):
+        """Validate statefulset pods are matched by owner rather than by name."""
+        statefulsets = next(
+            self.searcher.search_all([k8v.resource_types.ResourceType.STATEFUL_SETS])
+        )
+        assert sorted(self.calls) == ["pod", "statefulset"]
+        assert [[p.metadata.name for p in ss._related] for ss in statefulsets] == [
+            ["db-0"],
+            ["db-backup-0"],
+        ]
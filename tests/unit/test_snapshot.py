@@ -0,0 +1,87 @@
+import pytest
+import io
+
+import k8v
+
+from test_base import TestBase
+
+
+class TestSnapshot(TestBase):
+    """Validate resources can be saved to an indexed snapshot and lazily loaded from it."""
+
+    def setup(self):
+        self.resources = []
+        for name in ["deployments", "pods", "services"]:
+            self.resources += self.load_fixture(f"tests/fixtures/{name}.pickle")
+
+    def save(self, filename, related=False):
+        config = k8v.config.Config(
+            colors=None, output="snapshot", filename=str(filename), related=related
+        )
+        config.load()
+        k8v.printer.Printer(config).print_all(self.resources)
+
+    def test_index(self, tmp_path):
+        """Validate each resource is indexed once by type, namespace and name."""
+        self.save(tmp_path / "cluster.snapshot", related=True)
+        reader = k8v.snapshot.SnapshotReader(str(tmp_path / "cluster.snapshot"))
+        assert sorted(reader.types(), key=lambda t: t.value[0]) == [
+            k8v.resource_types.ResourceType.DEPLOYMENTS,
+            k8v.resource_types.ResourceType.PODS,
+            k8v.resource_types.ResourceType.REPLICA_SETS,
+            k8v.resource_types.ResourceType.SERVICES,
+        ]
+        pods = reader.entries(k8v.resource_types.ResourceType.PODS)
+        assert [(e.namespace, e.name) for e in pods] == [
+            ("default", "nginx-deployment-7b6fcd488c-sr2wv"),
+            ("default", "nginx-deployment-7b6fcd488c-vrgrx"),
+            ("default", "list-resources-4rcts"),
+        ]
+
+        # resources are loaded without their related resources
+        deployment = reader.load(
+            reader.entries(k8v.resource_types.ResourceType.DEPLOYMENTS)[0]
+        )
+        assert deployment.metadata.name == "nginx-deployment"
+        assert deployment._related == []
+        assert len(self.resources[0]._related) == 1
+        reader.close()
+
+    def test_not_snapshot(self):
+        """Validate pickle streams are not mistaken for snapshots."""
+        assert not k8v.snapshot.SnapshotReader.is_snapshot("tests/fixtures/pods.pickle")
+        with pytest.raises(Exception):
+            k8v.snapshot.SnapshotReader("tests/fixtures/pods.pickle")
+
+    def test_requires_file(self):
+        """Validate snapshots are not written to STDOUT (they are not seekable)."""
+        with pytest.raises(Exception):
+            k8v.config.Config(colors=None, output="snapshot").load()
+
+    def test_search(self, tmp_path, monkeypatch):
+        """Validate only the records matching the query are deserialized."""
+        self.save(tmp_path / "cluster.snapshot")
+        loaded = []
+        load = k8v.snapshot.SnapshotReader.load
+
+        def counting_load(reader, entry):
+            loaded.append(entry.name)
+            return load(reader, entry)
+
+        monkeypatch.setattr(k8v.snapshot.SnapshotReader, "load", counting_load)
+        config = k8v.config.Config(
+            colors=None,
+            file=io.StringIO(""),
+            output="brief",
+            snapshot=str(tmp_path / "cluster.snapshot"),
+            names=["nginx-deployment-7b6fcd488c-vrgrx"],
+            resources=[
+                k8v.resource_types.ResourceType.DEPLOYMENTS,
+                k8v.resource_types.ResourceType.PODS,
+            ],
+        )
+        k8v.viewer.Viewer(config).view()
+        assert (
+            config.file.getvalue() == "pod/default/nginx-deployment-7b6fcd488c-vrgrx\n"
+        )
+        assert loaded == ["nginx-deployment-7b6fcd488c-vrgrx"]
@@ -0,0 +1,76 @@
+import pytest
+import io
+
+import k8v
+
+
+class TestSnapshotBackend:
+    """Validate resources saved using the pickle formatter can be searched like a live cluster."""
+
+    def setup(self):
+        self.config = k8v.config.Config(
+            colors=None,
+            file=io.StringIO(""),
+            output="brief",
+            snapshot="tests/fixtures",
+            resources=[
+                k8v.resource_types.ResourceType.DEPLOYMENTS,
+                k8v.resource_types.ResourceType.PODS,
+            ],
+        )
+        self.viewer = k8v.viewer.Viewer(self.config)
+
+    def lines(self):
+        return self.config.file.getvalue().splitlines()
+
+    def test_view(self):
+        """Validate each resource is displayed once even if saved more than once."""
+        self.viewer.view()
+        assert self.lines() == [
+            "deployment/default/nginx-deployment",
+            "pod/default/list-resources-4rcts",
+            "pod/default/nginx-deployment-7b6fcd488c-sr2wv",
+            "pod/default/nginx-deployment-7b6fcd488c-vrgrx",
+        ]
+
+    def test_related(self):
+        """Validate related resources are found in the snapshot."""
+        self.config.related = True
+        self.config.resources = [k8v.resource_types.ResourceType.DEPLOYMENTS]
+        self.viewer.view()
+        assert self.lines() == [
+            "deployment/default/nginx-deployment",
+            "        replicaset/default/nginx-deployment-7b6fcd488c",
+            "                pod/default/nginx-deployment-7b6fcd488c-sr2wv",
+            "                pod/default/nginx-deployment-7b6fcd488c-vrgrx",
+        ]
+
+    def test_selectors(self):
+        """Validate the label and field selectors pushed down by the planner are applied."""
+        self.config.phase = "Succeeded"
+        self.viewer.view()
+        assert self.lines() == ["pod/default/list-resources-4rcts"]
+
+    def test_namespace(self):
+        """Validate only resources in the namespaces searched are displayed."""
+        self.config.namespaces = ["kube-system"]
+        self.viewer.view()
+        assert self.lines() == [
+            "pod/kube-system/kindnet-v7dpv",
+            "pod/kube-system/kube-proxy-7pjmw",
+        ]
+
+    def test_single_file(self):
+        """Validate a single snapshot file can be searched."""
+        self.config.snapshot = "tests/fixtures/replicasets.pickle"
+        self.viewer.view()
+        assert self.lines() == [
+            "pod/default/nginx-deployment-7b6fcd488c-sr2wv",
+            "pod/default/nginx-deployment-7b6fcd488c-vrgrx",
+        ]
+
+    def test_watch(self):
+        """Validate watching for changes requires a live cluster."""
+        self.config.watch = True
+        with pytest.raises(Exception):
+            self.viewer.view()
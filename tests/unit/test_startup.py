@@ -0,0 +1,45 @@
+import pytest
+import subprocess
+import sys
+
+
+class TestStartup:
+    """Validate heavy dependencies are not imported until they are needed."""
+
+    def imported(self, code: str) -> list:
+        """Run the code in a new interpreter and retrieve which of the heavy modules it imported."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"""import sys
+{code}
+print(" ".join(m for m in ["kubernetes", "k8v.searcher", "k8v.formatters.json_formatter"] if m in sys.modules))
+""",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.splitlines()[-1].split()
+
+    def test_import(self):
+        assert self.imported("import k8v") == []
+
+    def test_help(self):
+        """Validate displaying the help screen does not import the kubernetes client."""
+        assert self.imported("""import app
+try:
+    app.main(["-h"])
+except SystemExit:
+    pass""") == ["k8v.searcher"]
+
+    def test_formatter(self):
+        """Validate only the selected formatter is imported."""
+        assert self.imported("""import k8v
+k8v.config.Config(colors=None, output="brief").load()""") == []
+        assert (
+            self.imported("""import k8v
+k8v.config.Config(colors=None, output="json").load()""")
+            == ["k8v.formatters.json_formatter"]
+        )
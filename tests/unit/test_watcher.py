@@ -0,0 +1,206 @@
+import pytest
+import io
+import json
+import munch
+import types
+
+import kubernetes
+
+import k8v
+
+
+class TestWatcher:
+    """Validate watch events are applied to the cache and only changes are printed."""
+
+    def setup(self):
+        self.viewer: Viewer = k8v.viewer.Viewer(
+            k8v.config.Config(colors=None, file=io.StringIO(""), output="brief")
+        )
+        self.viewer.config.load()
+        self.watcher = k8v.watcher.Watcher(self.viewer)
+        self.watcher.searcher.fetch_resources = self.fetch_resources
+        self.type = k8v.resource_types.ResourceType.PODS
+
+    def pod(self, name, version="1", namespace="default"):
+        return munch.munchify(
+            {
+                "type": self.type,
+                "metadata": {
+                    "name": name,
+                    "namespace": namespace,
+                    "uid": f"uid-{name}",
+                    "resource_version": version,
+                    "labels": None,
+                },
+            }
+        )
+
+    def event(self, type, resource):
+        return {"type": type, "resource_type": self.type, "object": resource}
+
+    def fetch_resources(self, type, handler, namespace, **kwargs):
+        """Fake list returning two pods and the resourceVersion of the list."""
+        yield self.pod("nginx-1", "2")
+        yield self.pod("nginx-3")
+        return "3"
+
+    def lines(self):
+        return self.viewer.config.file.getvalue().splitlines()
+
+    def test_apply_events(self):
+        """Validate each event prints the resource and updates the cache."""
+        self.watcher.apply(self.event("ADDED", self.pod("nginx-1")))
+        self.watcher.apply(self.event("ADDED", self.pod("nginx-2")))
+        self.watcher.apply(self.event("MODIFIED", self.pod("nginx-1", "2")))
+        self.watcher.apply(self.event("DELETED", self.pod("nginx-2")))
+        assert self.lines() == [
+            "pod/default/nginx-1",
+            "pod/default/nginx-2",
+            "pod/default/nginx-1",
+            "pod/default/nginx-2",
+        ]
+        assert list(self.watcher.resources) == [(self.type, "uid-nginx-1")]
+
+    def test_apply_related(self):
+        """Validate an updated resource keeps its related resources."""
+        self.viewer.config.related = True
+        self.watcher.apply(self.event("ADDED", self.pod("nginx-1")))
+        child = self.pod("nginx-1-child")
+        child._related = []
+        self.watcher.resources[(self.type, "uid-nginx-1")]._related = [child]
+
+        self.watcher.apply(self.event("MODIFIED", self.pod("nginx-1", "2")))
+        resource = self.watcher.resources[(self.type, "uid-nginx-1")]
+        assert resource.metadata.resource_version == "2"
+        assert resource._related == [child]
+        assert self.lines() == [
+            "pod/default/nginx-1",
+            "pod/default/nginx-1",
+            "        pod/default/nginx-1-child",
+        ]
+
+    def test_apply_filtered(self):
+        """Validate filtered resources are ignored, or removed if they no longer match."""
+        self.viewer.config.excludes.append("nginx-2")
+        self.watcher.apply(self.event("ADDED", self.pod("nginx-2")))
+        assert self.lines() == []
+
+        self.watcher.apply(self.event("ADDED", self.pod("nginx-1")))
+        self.viewer.config.excludes.append("nginx-1")
+        self.watcher.apply(self.event("MODIFIED", self.pod("nginx-1", "2")))
+        assert self.lines() == ["pod/default/nginx-1", "pod/default/nginx-1"]
+        assert self.watcher.resources == {}
+
+    def test_relist(self):
+        """Validate listing the resources again only prints the differences."""
+        for name in ["nginx-1", "nginx-2"]:
+            self.watcher.apply(self.event("ADDED", self.pod(name)))
+        self.watcher.apply(self.event("ADDED", self.pod("other", namespace="other")))
+        self.viewer.config.file = io.StringIO("")
+
+        resources, resource_version = self.watcher.list(self.type, None, "default", {})
+        assert resource_version == "3"
+        self.watcher.apply(
+            {
+                "type": "RELIST",
+                "resource_type": self.type,
+                "namespace": "default",
+                "object": resources,
+            }
+        )
+        assert self.lines() == [
+            "pod/default/nginx-1",
+            "pod/default/nginx-3",
+            "pod/default/nginx-2",
+        ]
+        assert sorted(k[1] for k in self.watcher.resources) == [
+            "uid-nginx-1",
+            "uid-nginx-3",
+            "uid-other",
+        ]
+
+    def stream_pod(self, monkeypatch) -> dict:
+        """Stream a single (modified) pod using a fake watch and retrieve its event."""
+        data = {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {"name": "nginx-1", "namespace": "default", "uid": "uid-1"},
+        }
+
+        class FakeWatch:
+            resource_version = "2"
+
+            def stream(self, handler, *args, **kwargs):
+                yield {
+                    "type": "MODIFIED",
+                    "raw_object": data,
+                    "object": kubernetes.client.ApiClient().deserialize(
+                        types.SimpleNamespace(data=json.dumps(data)), "V1Pod"
+                    ),
+                }
+                raise kubernetes.client.rest.ApiException(status=500)
+
+        monkeypatch.setattr(kubernetes.watch, "Watch", FakeWatch)
+        self.watcher.searcher.backend.handlers = {
+            self.type: k8v.registry.Handler(None, None, "V1Pod")
+        }
+        self.watcher.stream(self.type, None, "default", "1", {})
+        event = self.watcher.events.get()
+        assert self.watcher.events.get()["type"] == "ERROR"
+        return event
+
+    def test_stream(self, monkeypatch):
+        """Validate the events are annotated like the resources listed."""
+        resource = self.stream_pod(monkeypatch)["object"]
+        assert isinstance(resource, kubernetes.client.V1Pod)
+        assert resource.type == self.type
+        assert (resource.apiVersion, resource.kind) == ("v1", "Pod")
+
+    def test_stream_raw(self, monkeypatch):
+        """Validate the events are RawResources in raw mode (like the resources listed)."""
+        self.viewer.config.raw = True
+        resource = self.stream_pod(monkeypatch)["object"]
+        assert isinstance(resource, k8v.raw_resource.RawResource)
+        assert resource.type == self.type
+        assert resource.metadata.name == "nginx-1"
+        assert resource.to_dict()["apiVersion"] == "v1"
+
+    def test_stream_gone(self, monkeypatch):
+        """Validate an expired watch (410 Gone) lists the resources again."""
+        watches = []
+
+        class FakeWatch:
+            def __init__(self):
+                watches.append(self)
+
+            def stream(self, handler, *args, **kwargs):
+                if len(watches) == 1:
+                    raise kubernetes.client.rest.ApiException(status=410)
+                raise kubernetes.client.rest.ApiException(status=500)
+
+        monkeypatch.setattr(kubernetes.watch, "Watch", FakeWatch)
+        self.watcher.stream(self.type, None, "default", "1", {})
+
+        relist = self.watcher.events.get()
+        assert relist["type"] == "RELIST"
+        assert [r.metadata.name for r in relist["object"]] == ["nginx-1", "nginx-3"]
+        assert self.watcher.events.get()["type"] == "ERROR"
+
+    def test_stream_metrics(self, monkeypatch, tmp_path):
+        """Validate each watch connection (and the failed one) is recorded in the metrics."""
+        calls = []
+
+        class FakeWatch:
+            def stream(self, handler, *args, **kwargs):
+                calls.append(args)
+                if len(calls) == 1:
+                    raise kubernetes.client.rest.ApiException(status=410)
+                raise kubernetes.client.rest.ApiException(status=500)
+
+        monkeypatch.setattr(kubernetes.watch, "Watch", FakeWatch)
+        self.viewer.config.metrics_file = str(tmp_path / "metrics.json")
+        self.watcher.stream(self.type, None, "default", "1", {})
+
+        summary = self.viewer.config.metrics.summary()
+        assert summary["watches"] == 2
+        assert summary["errors"] == 1